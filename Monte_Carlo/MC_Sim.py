@@ -1,6 +1,587 @@
+import asyncio
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
 import numpy as np
 import pandas as pd
 
+# rolls per independently seeded block of a Game play#
+_BLOCK_ROLLS = 1 << 16
+# largest key space counted into a dense array rather than with np.unique#
+_DENSE_KEYS = 1 << 20
+# rolls of a memory-mapped result an analyzer reads at a time#
+_FOLD_ROLLS = 1 << 22
+
+
+def _as_generator(seed):
+    """
+    Turns a seed into a NumPy random Generator.
+    
+    Parameters:
+        seed: None, int, numpy.random.SeedSequence or numpy.random.Generator
+            A Generator is used as is; anything else seeds a new one
+            (None draws fresh entropy from the OS).
+        
+    Returns:
+        numpy.random.Generator
+    """
+    
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def _spawn_seeds(rng, n):
+    """
+    Spawns independent child seeds from a generator's SeedSequence.
+    
+    Parameters:
+        rng: numpy.random.Generator
+            Parent generator; each call hands out fresh children.
+        n: int
+            Number of child seeds.
+        
+    Returns:
+        list: n numpy.random.SeedSequence objects.
+    """
+    
+    return rng.bit_generator.seed_seq.spawn(n)
+
+
+class _AliasTable():
+    """
+    A Walker/Vose alias table for drawing from a fixed set of weights.
+    
+    Building the table is O(n) in the number of faces; every draw after
+    that is O(1): one uniform column pick and one biased coin flip.
+    
+    Attributes:
+        prob (numpy.ndarray): Probability of keeping the picked column
+        alias (numpy.ndarray): Column to fall back on when the coin flip fails
+    """
+    
+    def __init__(self, weights):
+        """
+        Builds the alias table from a set of non-negative weights.
+        
+        Parameters:
+            weights: numpy.ndarray
+                Weight of each face, in face order.
+            
+        Raises:
+            ValueError: If the weights do not sum to a positive number.
+        """
+        
+        weights = np.asarray(weights, dtype=float)
+        total = weights.sum()
+        if not total > 0:
+            raise ValueError("The die weights must sum to a positive number.")
+
+        n = len(weights)
+        scaled = (weights * n / total).tolist()
+        prob = np.ones(n)
+        alias = np.arange(n)
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        # pair each under-full column with an over-full one#
+        while small and large:
+            under = small.pop()
+            over = large.pop()
+            prob[under] = scaled[under]
+            alias[under] = over
+            scaled[over] = scaled[over] + scaled[under] - 1.0
+            if scaled[over] < 1.0:
+                small.append(over)
+            else:
+                large.append(over)
+        # whatever is left over is full up to rounding error#
+        self.prob = prob
+        self.alias = alias
+
+    def sample(self, rng, size, out=None):
+        """
+        Draws face positions from the table.
+        
+        Parameters:
+            rng: numpy.random.Generator
+                Source of the random draws.
+            size: int
+                Number of draws.
+            out: numpy.ndarray, optional
+                Integer array of length size to write the positions into.
+            
+        Returns:
+            numpy.ndarray: Integer positions into the face array.
+        """
+        
+        column = rng.integers(len(self.prob), size=size)
+        keep = rng.random(size) < self.prob[column]
+        if out is None:
+            out = np.empty(size, dtype=np.intp)
+        np.take(self.alias, column, out=out)
+        np.copyto(out, column, where=keep, casting='unsafe')
+        return out
+
+
+class _FenwickTree():
+    """
+    A Fenwick (binary indexed) tree over a set of weights.
+    
+    Unlike the alias table it can change one weight in place, so both
+    weight updates and draws cost O(log n) in the number of faces.
+    
+    Attributes:
+        tree (numpy.ndarray): 1-based partial sums; tree[i] covers the
+            weights in (i - lowbit(i), i]
+        weights (numpy.ndarray): Current weight of each face
+    """
+    
+    def __init__(self, weights):
+        """
+        Builds the tree from a set of non-negative weights in O(n).
+        
+        Parameters:
+            weights: numpy.ndarray
+                Weight of each face, in face order.
+        """
+        
+        self.weights = np.array(weights, dtype=float)
+        n = len(self.weights)
+        cumulative = np.concatenate(([0.0], np.cumsum(self.weights)))
+        i = np.arange(1, n + 1)
+        self.tree = np.zeros(n + 1)
+        self.tree[1:] = cumulative[i] - cumulative[i - (i & -i)]
+        # largest power of two not above n, where the descent starts#
+        self._top = 1 << (n.bit_length() - 1) if n else 0
+
+    def update(self, position, weight):
+        """
+        Sets the weight of one face.
+        
+        Parameters:
+            position: int
+                Position of the face in the face array.
+            weight: float
+                The new, non-negative weight.
+        """
+        
+        delta = weight - self.weights[position]
+        self.weights[position] = weight
+        i = position + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def total(self):
+        """
+        Returns the sum of all weights.
+        """
+        
+        total = 0.0
+        i = len(self.tree) - 1
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def sample(self, rng, size, out=None):
+        """
+        Draws face positions by descending the tree for all draws at once.
+        
+        Parameters:
+            rng: numpy.random.Generator
+                Source of the random draws.
+            size: int
+                Number of draws.
+            out: numpy.ndarray, optional
+                Integer array of length size to write the positions into.
+            
+        Returns:
+            numpy.ndarray: Integer positions into the face array.
+            
+        Raises:
+            ValueError: If the weights do not sum to a positive number.
+        """
+        
+        total = self.total()
+        if not total > 0:
+            raise ValueError("The die weights must sum to a positive number.")
+
+        n = len(self.weights)
+        target = rng.random(size) * total
+        position = np.zeros(size, dtype=np.intp)
+        step = self._top
+        # find the last prefix whose sum does not exceed the target#
+        while step:
+            candidate = position + step
+            inside = candidate <= n
+            prefix = self.tree[np.where(inside, candidate, 0)]
+            move = inside & (prefix <= target)
+            position = np.where(move, candidate, position)
+            target = np.where(move, target - prefix, target)
+            step >>= 1
+        # rounding can push a draw just past the last face#
+        return np.minimum(position, n - 1, out=out, casting='unsafe')
+
+
+def _search_codes(cdf, rows, draws, out=None):
+    """
+    Finds the face each uniform draw lands on in its die's cumulative weights.
+    
+    Every die is searched in its own row of ``cdf`` with a branch-free
+    binary search over the whole draw array at once: the row offsets are
+    added to the search positions rather than to the draws, so no
+    rounding can carry a draw into the next die's row.
+    
+    Parameters:
+        cdf: numpy.ndarray
+            Normalized cumulative weights of shape (n_rows, n_faces), as
+            built by ``_stacked_cdf``.
+        rows: numpy.ndarray
+            Row of ``cdf`` for each draw, broadcastable against draws.
+        draws: numpy.ndarray
+            Uniform draws in [0, 1).
+        out: numpy.ndarray, optional
+            Integer array shaped like draws to write the face positions into.
+        
+    Returns:
+        numpy.ndarray: Face positions shaped like draws.
+    """
+    
+    n_faces = cdf.shape[1]
+    flat = cdf.ravel()
+    base = rows * n_faces - 1
+    position = np.zeros(draws.shape, dtype=np.intp)
+    # the last face closes every row at 1.0, so only the others are searched#
+    step = (1 << (n_faces - 1).bit_length()) >> 1
+    while step:
+        candidate = position + step
+        inside = candidate < n_faces
+        move = inside & (flat[base + np.where(inside, candidate, 1)] <= draws)
+        np.copyto(position, candidate, where=move)
+        step >>= 1
+    if out is None:
+        return position
+    np.copyto(out, position, casting='unsafe')
+    return out
+
+
+def _sample_codes(cdf, rng, n_rolls, out=None):
+    """
+    Draws a code matrix for several dice with one uniform draw.
+    
+    Parameters:
+        cdf: numpy.ndarray
+            Cumulative weights of shape (n_dice, n_faces), as built by
+            ``_stacked_cdf``.
+        rng: numpy.random.Generator
+            Source of the random draws.
+        n_rolls: int
+            Number of rolls of all the dice.
+        out: numpy.ndarray, optional
+            Integer array of shape (n_rolls, n_dice) to write the face
+            positions into.
+        
+    Returns:
+        numpy.ndarray: Face positions of shape (n_rolls, n_dice).
+    """
+    
+    draws = rng.random((n_rolls, len(cdf)))
+    return _search_codes(cdf, np.arange(len(cdf)), draws, out=out)
+
+
+def _fill_blocks(sample, seeds, out):
+    """
+    Fills an outcome array block by block, one child seed per block.
+    
+    Block i always covers rows ``i * _BLOCK_ROLLS`` onwards and is drawn
+    from ``seeds[i]`` alone, so the result does not depend on how the
+    blocks are shared out between workers.
+    
+    Parameters:
+        sample: callable
+            ``sample(rng, size, out=rows)`` writes size outcomes into rows.
+        seeds: list
+            One numpy.random.SeedSequence per block.
+        out: numpy.ndarray
+            Integer array whose first axis is the rolls.
+        
+    Returns:
+        numpy.ndarray: out.
+    """
+    
+    for i, seed in enumerate(seeds):
+        rows = out[i * _BLOCK_ROLLS:(i + 1) * _BLOCK_ROLLS]
+        sample(np.random.default_rng(seed), len(rows), out=rows)
+    return out
+
+
+def _sample_blocks(sample, seeds, shape, dtype):
+    """
+    Samples a run of consecutive blocks into a new array.
+    
+    This is the process pool task behind ``_run_blocks``.
+    
+    Returns:
+        numpy.ndarray: Outcomes of the given shape and dtype.
+    """
+    
+    return _fill_blocks(sample, seeds, np.empty(shape, dtype=dtype))
+
+
+def _run_blocks(sample, seeds, out, workers=None, backend='process'):
+    """
+    Fills out block by block, optionally spread over a pool.
+    
+    Each worker gets a contiguous run of blocks. Threads write straight
+    into their own slice of out, which pays off because NumPy releases
+    the GIL while sampling; processes return their slice to be copied in.
+    
+    Parameters:
+        sample: callable
+            ``sample(rng, size, out=rows)``; must be picklable for the
+            process backend.
+        seeds: list
+            One numpy.random.SeedSequence per block.
+        out: numpy.ndarray
+            Integer array whose first axis is the rolls.
+        workers: int, optional
+            Pool size (default is to fill out in this thread).
+        backend: str, optional
+            'process' or 'thread' (default is 'process').
+        
+    Returns:
+        numpy.ndarray: out.
+        
+    Raises:
+        ValueError: If backend is not 'process' or 'thread'.
+    """
+    
+    if backend not in ('process', 'thread'):
+        raise ValueError("backend must be 'process' or 'thread'")
+    if workers is None or workers <= 1 or len(seeds) <= 1:
+        return _fill_blocks(sample, seeds, out)
+
+    shards = np.array_split(np.arange(len(seeds)), min(workers, len(seeds)))
+    runs = [(shard[0], shard[-1] + 1) for shard in shards]
+    rows = [out[first * _BLOCK_ROLLS:last * _BLOCK_ROLLS] for first, last in runs]
+    if backend == 'thread':
+        with ThreadPoolExecutor(max_workers=len(runs)) as pool:
+            futures = [pool.submit(_fill_blocks, sample, seeds[first:last], chunk)
+                       for (first, last), chunk in zip(runs, rows)]
+            for future in futures:
+                future.result()
+    else:
+        with ProcessPoolExecutor(max_workers=len(runs)) as pool:
+            blocks = pool.map(_sample_blocks,
+                              [sample] * len(runs),
+                              [seeds[first:last] for first, last in runs],
+                              [chunk.shape for chunk in rows],
+                              [out.dtype] * len(runs))
+            for chunk, block in zip(rows, blocks):
+                chunk[...] = block
+    return out
+
+
+def _dice_path(path):
+    """
+    Returns the path of the dice file saved next to a results file.
+    """
+    
+    return os.path.splitext(path)[0] + '.dice.npz'
+
+
+def _dice_from_weights(faces, weights):
+    """
+    Rebuilds a list of dice from a face table and a weight matrix.
+    
+    Parameters:
+        faces: numpy.ndarray
+            The shared face table.
+        weights: numpy.ndarray
+            Weights of shape (n_dice, n_faces) in face table order.
+        
+    Returns:
+        list: One Die per row of weights.
+    """
+    
+    dice = [Die(np.array(faces)) for _ in range(len(weights))]
+    for die, row in zip(dice, weights):
+        die._weights[:] = row
+    return dice
+
+
+def _import_pyarrow():
+    """
+    Imports pyarrow and pyarrow.parquet, which are optional dependencies.
+    
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Arrow and Parquet support needs pyarrow: pip install pyarrow")
+    return pa, pq
+
+
+def _batch_codes(batch, face_index, dtype):
+    """
+    Turns a record batch of dictionary-encoded die columns into codes.
+    
+    Each column's dictionary is mapped onto the face table, so batches
+    whose dictionaries differ in order or content still line up. Parquet
+    only restores the dictionary type for string faces; other columns
+    are dictionary encoded again by Arrow here.
+    
+    Parameters:
+        batch: pyarrow.RecordBatch
+            One dictionary-encoded column per die.
+        face_index: pandas.Index
+            The face table.
+        dtype: numpy.dtype
+            Integer dtype of the returned codes.
+        
+    Returns:
+        numpy.ndarray: Face positions of shape (rows, n_dice).
+        
+    Raises:
+        ValueError: If a column holds a face that is not in the face table.
+    """
+    
+    codes = np.empty((batch.num_rows, batch.num_columns), dtype=dtype)
+    for i, column in enumerate(batch.columns):
+        if not hasattr(column, 'dictionary'):
+            column = column.dictionary_encode()
+        remap = face_index.get_indexer(column.dictionary.to_numpy(zero_copy_only=False))
+        if (remap < 0).any():
+            raise ValueError("Results hold faces that are not on the dice")
+        np.take(remap, column.indices.to_numpy(), out=codes[:, i])
+    return codes
+
+
+def _atomic_save(path, array):
+    """
+    Saves an array to a .npy file so a crash never leaves half a file.
+    """
+    
+    partial_path = path + '.partial'
+    with open(partial_path, 'wb') as file:
+        np.save(file, array)
+    os.replace(partial_path, path)
+
+
+def _check_executor(executor):
+    """
+    Rejects executors that would run a play on a pickled copy of the game.
+    
+    Raises:
+        ValueError: If executor is given and is not a thread pool.
+    """
+    
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise ValueError("executor must be a ThreadPoolExecutor; use workers and "
+                         "backend='process' to sample in other processes")
+
+
+def _jsonable(value):
+    """
+    Turns the numpy arrays and scalars in a nested state dict into plain
+    lists and numbers, so any bit generator's state can go into JSON.
+    """
+    
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _write_checkpoint(folder, state):
+    """
+    Atomically rewrites a checkpoint folder's state.json.
+    """
+    
+    partial_path = os.path.join(folder, 'state.json.partial')
+    with open(partial_path, 'w') as file:
+        json.dump(state, file)
+    os.replace(partial_path, os.path.join(folder, 'state.json'))
+
+
+def _align_weights(dice, index):
+    """
+    Lines the dice's weights up against a shared face table.
+    
+    Parameters:
+        dice: list
+            Die objects.
+        index: pandas.Index
+            The face table.
+        
+    Returns:
+        numpy.ndarray: Weights of shape (n_dice, n_faces) in face table order.
+        
+    Raises:
+        ValueError: If a die's faces differ from the face table.
+    """
+    
+    weights = np.zeros((len(dice), len(index)))
+    for i, die in enumerate(dice):
+        positions = index.get_indexer(die._faces)
+        if len(die._faces) != len(index) or (positions < 0).any():
+            raise ValueError("All dice must have the same faces")
+        weights[i, positions] = die._weights
+    return weights
+
+
+def _stacked_cdf(weights):
+    """
+    Stacks several dice's cumulative weights for ``_sample_codes``.
+    
+    Parameters:
+        weights: numpy.ndarray
+            Weights of shape (n_dice, n_faces), one row per die.
+        
+    Returns:
+        numpy.ndarray: Shape (n_dice, n_faces); row j is die j's
+        normalized cumulative weights.
+        
+    Raises:
+        ValueError: If a die's weights are all zero.
+    """
+    
+    totals = weights.sum(axis=1, keepdims=True)
+    if not (totals > 0).all():
+        raise ValueError("The die weights must sum to a positive number.")
+    cdf = np.cumsum(weights, axis=1) / totals
+    # the last face closes each row exactly#
+    cdf[:, -1] = 1.0
+    return cdf
+
+
+def _code_dtype(n_faces):
+    """
+    Returns the smallest unsigned integer dtype that holds every face code.
+    """
+    
+    return np.min_scalar_type(max(n_faces - 1, 0))
+
+
+def _holds_codes(dtype, n_faces):
+    """
+    Tells whether an integer dtype holds every face code without wrapping.
+    """
+    
+    return np.issubdtype(dtype, np.integer) and n_faces - 1 <= np.iinfo(dtype).max
+
+
 class Die():
     """
     A class representing a die with customizable faces and weights.
@@ -13,16 +594,21 @@ class Die():
     
     Attributes:
     sides (numpy.ndarray): Array of unique face values for the die
-    die (pandas.DataFrame): DataFrame storing faces as index and their weights
+    die (pandas.DataFrame): DataFrame storing faces as index and their weights,
+        built on demand from the underlying face and weight arrays
+    sampler (str): 'alias', 'fenwick' or 'auto', the way rolls are drawn
 
     Methods:
     change_face_weight(face, new_weight): Changes the weight of a specific face
-    roll_die(r=1): Rolls the die r times and returns results
+    change_weights(weights): Changes the weights of many faces at once
+    roll_die(roll=1, output=None, out=None, workers=None): Rolls the die and returns results as a
+        list (the default), an array of faces, or face codes; an array when out is given
+    iter_rolls(total, chunk_size): Yields the outcomes of many rolls in fixed-size chunks
     die_state(): Prints current state of die faces and weights
     """
     
     
-    def __init__(self, sides):
+    def __init__(self, sides, rng=None, sampler='auto'):
         """
         Initializes the die with given sides and default weight of 1.0
         for each side.
@@ -30,29 +616,60 @@ class Die():
         Parameters:
             sides: numpy.ndarray
                 An array of unique face values.
+            rng: int, numpy.random.SeedSequence or numpy.random.Generator, optional
+                Seed or generator for this die's rolls (default is fresh
+                OS entropy).
+            sampler: str, optional
+                How rolls are drawn (default is 'auto')
+                    - 'alias': Alias table, O(1) draws but rebuilt after
+                      every weight change
+                    - 'fenwick': Fenwick tree, O(log n) draws and
+                      O(log n) in-place weight changes
+                    - 'auto': Picks whichever is cheaper for the
+                      weight changes and rolls seen so far
             
         Raises:
             TypeError: If input is not a NumPy array.
-            ValueError: If face values are not unique.
+            ValueError: If face values are not unique or sampler is not
+                'auto', 'alias' or 'fenwick'.
         """
         
+        if sampler not in ('auto', 'alias', 'fenwick'):
+            raise ValueError("sampler must be 'auto', 'alias' or 'fenwick'")
+
         self.sides = sides
         # if it is a numpy array#
         if isinstance(sides, np.ndarray):
+            # hash index from face to position#
+            self._index = pd.Index(sides)
             # test for uniqueness#
-            if len(self.sides) == len(set(self.sides)):
-                # set up weights variable#
-                weights = np.array([1])
-                # make weights same length as sides#
-                while len(weights) < len(self.sides):
-                    weights = np.append(weights, 1)
-                # set up dataframe#
-                self.die = pd.DataFrame({'Faces': self.sides, 'Weight': weights})
-                self.die.set_index('Faces', inplace=True)
+            if self._index.is_unique:
+                # faces and weights live in flat arrays#
+                self._faces = sides.copy()
+                self._weights = np.ones(len(sides))
+                # sampler is built on the first roll#
+                self.sampler = sampler
+                self._sampler = None
+                self._rng = _as_generator(rng)
+                # usage counts that drive the 'auto' sampler choice#
+                self._n_updates = 0
+                self._n_draws = 0
             else:
                 raise ValueError('The array has repeated sides')
         else:
             raise TypeError('Sides is not a numpy array')
+
+    @property
+    def die(self):
+        """
+        DataFrame storing faces as index and their weights.
+        
+        The frame is built from the face and weight arrays every time
+        it is accessed, so writing to it does not change the die.
+        """
+        
+        die = pd.DataFrame({'Faces': self._faces, 'Weight': self._weights})
+        return die.set_index('Faces')
             
     def change_weight(self, face, new_weight):
         """
@@ -68,7 +685,9 @@ class Die():
             ValueError: If the weight is negative.
         """
         
-        if face not in self.sides:
+        try:
+            position = self._index.get_loc(face)
+        except (KeyError, TypeError):
             raise IndexError("Face not found on die")
 
         try:
@@ -79,24 +698,231 @@ class Die():
         if new_weight < 0:
             raise ValueError("The weight must be non-negative.")
 
-        self.die.loc[face, 'Weight'] = new_weight
+        self._weights[position] = new_weight
+        self._n_updates += 1
+        if isinstance(self._sampler, _FenwickTree):
+            self._sampler.update(position, new_weight)
+        else:
+            self._sampler = None
+
+    def change_weights(self, weights):
+        """
+        Changes the weights of many faces at once.
         
-    def roll_die(self, roll=1):
+        Every face and weight is checked before anything is written, so
+        a bad entry leaves the die unchanged.
+        
+        Parameters:
+            weights: dict or pandas.Series
+                New weights keyed (or indexed) by face value.
+            
+        Raises:
+            IndexError: If any face is not found.
+            TypeError: If any weight is not numeric.
+            ValueError: If any weight is negative.
+        """
+        
+        if not isinstance(weights, pd.Series):
+            weights = pd.Series(weights, dtype=object)
+
+        positions = self._index.get_indexer(weights.index)
+        if (positions < 0).any():
+            missing = list(weights.index[positions < 0])
+            raise IndexError(f"Faces not found on die: {missing}")
+
+        try:
+            new_weights = weights.to_numpy(dtype=float)
+        except (ValueError, TypeError):
+            raise TypeError("The weights must be numeric or castable to float.")
+
+        if (new_weights < 0).any():
+            raise ValueError("The weights must be non-negative.")
+
+        self._weights[positions] = new_weights
+        self._n_updates += len(positions)
+        # one vectorized rebuild beats many single tree updates#
+        self._sampler = None
+        
+    def roll_die(self, roll=1, output=None, out=None, workers=None):
         """
         Rolls the die one or more times.
         
         Parameters:
-            n: int, optional
+            roll: int, optional
                 number of times to roll the die (default is 1 roll).
+            output: str, optional
+                Form of the outcomes (default is 'list', or 'array' when
+                out is given)
+                    - 'list': A Python list of face values
+                    - 'array': A NumPy array of face values
+                    - 'codes': A NumPy array of integer face positions,
+                      which map back to faces through ``sides[codes]``
+            out: numpy.ndarray, optional
+                Caller-owned array of length roll (a memmap or shared
+                memory view works too) that the outcomes are written
+                into instead of a new array.
+            workers: int, optional
+                Number of threads to share the rolls between. The rolls
+                are then drawn in blocks, each from its own seed spawned
+                off the die's generator, so results do not depend on the
+                number of threads (default is one direct draw).
             
         Returns:
-            list: Outcome of the die rolls based on face weight.
+            list or numpy.ndarray: Outcome of the die rolls based on face
+            weight; out itself when it is given.
+            
+        Raises:
+            ValueError: If every face has a weight of zero, output is
+                not 'list', 'array' or 'codes', or out has the wrong
+                shape or a dtype the outcomes cannot be safely cast to.
         
         """
-        probs = self.die['Weight'] / self.die['Weight'].sum()
-        die_roll = list(np.random.choice(self.die.index, size=roll, p=probs))
+        if output is None:
+            output = 'list' if out is None else 'array'
+        if output not in ('list', 'array', 'codes'):
+            raise ValueError("output must be 'list', 'array' or 'codes'")
+        if out is not None:
+            if output == 'list':
+                raise ValueError("out needs output='array' or 'codes'")
+            if out.shape != (roll,):
+                raise ValueError(f"out must have shape ({roll},)")
+            if output == 'codes' and not _holds_codes(out.dtype, len(self._faces)):
+                raise ValueError("out must be an integer array that holds every face code")
+            if output == 'array' and not np.can_cast(self._faces.dtype, out.dtype):
+                raise ValueError(f"out must be an array that {self._faces.dtype} faces cast to safely")
+
+        if output == 'codes':
+            return self._draw(roll, workers, out=out)
+        codes = self._draw(roll, workers)
+        if output == 'array':
+            return np.take(self._faces, codes, out=out)
+        die_roll = list(self._faces[codes])
         return die_roll
+
+    def iter_rolls(self, total, chunk_size=65536, output='array'):
+        """
+        Rolls the die ``total`` times, yielding the outcomes in chunks.
+        
+        Every chunk is written into the same buffer, so memory stays at
+        one chunk however large ``total`` is. A yielded chunk is only
+        valid until the next one is requested; copy it to keep it.
+        
+        Parameters:
+            total: int
+                Total number of times to roll the die.
+            chunk_size: int, optional
+                Number of rolls per chunk (default is 65536). The last
+                chunk may be shorter.
+            output: str, optional
+                'array' for face values or 'codes' for face positions
+                (default is 'array').
+            
+        Yields:
+            numpy.ndarray: The next chunk of outcomes.
+            
+        Raises:
+            ValueError: If total is negative, chunk_size is not positive
+                or output is not 'array' or 'codes'.
+        """
+        
+        if total < 0:
+            raise ValueError("total must be non-negative")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if output not in ('array', 'codes'):
+            raise ValueError("output must be 'array' or 'codes'")
+
+        dtype = np.intp if output == 'codes' else self._faces.dtype
+        buffer = np.empty(min(total, chunk_size), dtype=dtype)
+        done = 0
+        while done < total:
+            chunk = buffer[:min(chunk_size, total - done)]
+            if output == 'codes':
+                self._sample(len(chunk), self._rng, out=chunk)
+            else:
+                np.take(self._faces, self._sample(len(chunk), self._rng), out=chunk)
+            done += len(chunk)
+            yield chunk
     
+    def _draw(self, roll, workers, out=None):
+        """
+        Draws face positions directly or in seeded blocks over threads.
+        
+        Parameters:
+            roll: int
+                Number of draws.
+            workers: int or None
+                Thread count, or None for one direct draw.
+            out: numpy.ndarray, optional
+                Integer array of length roll to write the positions into.
+            
+        Returns:
+            numpy.ndarray: Integer positions into the face array.
+        """
+        
+        if workers is None:
+            return self._sample(roll, self._rng, out=out)
+        if out is None:
+            out = np.empty(roll, dtype=np.intp)
+        # build the sampler once, before the threads share it#
+        sampler = self._current_sampler(roll)
+        seeds = _spawn_seeds(self._rng, -(-roll // _BLOCK_ROLLS))
+        return _run_blocks(sampler.sample, seeds, out, workers, 'thread')
+
+    def _sample(self, roll, rng, out=None):
+        """
+        Draws face positions from the die's current weights.
+        
+        Parameters:
+            roll: int
+                Number of draws.
+            rng: numpy.random.Generator
+                Source of the random draws.
+            out: numpy.ndarray, optional
+                Integer array of length roll to write the positions into.
+            
+        Returns:
+            numpy.ndarray: Integer positions into the face array.
+        """
+        
+        return self._current_sampler(roll).sample(rng, roll, out=out)
+
+    def _current_sampler(self, roll):
+        """
+        Counts an upcoming draw of roll outcomes and returns the sampler
+        to use, building it if the weights changed since the last roll.
+        
+        Returns:
+            _AliasTable or _FenwickTree
+        """
+        
+        self._n_draws += roll
+        kind = self.sampler
+        if kind == 'auto':
+            kind = self._cheaper_sampler()
+        if kind == 'fenwick' and not isinstance(self._sampler, _FenwickTree):
+            self._sampler = _FenwickTree(self._weights)
+        elif kind == 'alias' and not isinstance(self._sampler, _AliasTable):
+            # the table is cached until the next weight change#
+            self._sampler = _AliasTable(self._weights)
+        return self._sampler
+
+    def _cheaper_sampler(self):
+        """
+        Picks a sampler from the weight changes and draws seen so far.
+        
+        An alias table pays O(n) per weight change and O(1) per draw; a
+        Fenwick tree pays O(log n) for both.
+        
+        Returns:
+            str: 'alias' or 'fenwick'.
+        """
+        
+        n = len(self._weights)
+        alias_cost = self._n_updates * n + self._n_draws
+        fenwick_cost = (self._n_updates + self._n_draws) * max(np.log2(n), 1.0)
+        return 'fenwick' if fenwick_cost < alias_cost else 'alias'
+
     def show_die(self):
         """
         Shows the current state for the die.
@@ -106,7 +932,7 @@ class Die():
         
         """
         
-        return self.die.copy()
+        return self.die
         
         
         
@@ -117,51 +943,669 @@ class Game():
     Each die must have the same number of sides and faces, but can have different weights.
     Each game is initialized with a Python list that contains one or more dice.
     Game objects have a behavior to play a game, i.e. to roll all of the dice a given number of times.
-    Game objects only keep the results of their most recent play.
+    Game objects only keep the results of their most recent play, unless it is topped up with ``play(n_rolls, append=True)``.
     
     Attributes:
         dice (list): A list of Die objects to be used in the game
         results (DataFrame): A DataFrame containing the results of the dice rolls, where each column represents a die and each row represents a roll
 
     Methods:
-        play(n_rolls): Rolls all dice n_rolls times and stores results
+        play(n_rolls, out=None, workers=None, backend='process', path=None, append=False): Rolls all dice n_rolls times and stores results
+        open(path): Reopens memory-mapped results saved by play
+        resume(checkpoint): Finishes a checkpointed play that was interrupted
+        to_arrow(), to_parquet(path): Export the results with dictionary-encoded face columns
+        from_arrow(table), from_parquet(path): Rebuild a game from exported results
+        play_iter(n_rolls, chunk_size): Rolls all dice n_rolls times, yielding coded results in chunks
+        play_async(n_rolls), play_iter_async(n_rolls, chunk_size): asyncio versions of play and play_iter
         show(form): Returns the results in either 'wide' or 'narrow' format
     """
     
             
-    def __init__(self, dice):
+    def __init__(self, dice, rng=None):
+        """
+        Initialize a new dice game.
+
+        Parameters:
+            dice : list
+                 A list of Die objects to be used in the game.
+            rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+                 Seed or generator for the game's rolls (default is fresh
+                 OS entropy). Plays draw from this stream, not the dice's own.
+
+        Returns:
+            None
+            
+        """
+
+        self.dice = dice
+        self._rng = _as_generator(rng)
+        # code matrix chunks of the last play, the face table they index
+        # and the weights of the dice that rolled them#
+        self._chunks = []
+        self._faces = None
+        self._weights = None
+        self._frame = None
+        self._narrow = None
+        # bumped whenever a play replaces the results#
+        self._generation = 0
+
+    @property
+    def _codes(self):
+        """
+        The stored code matrix, or None before the first play.
+        
+        Appended chunks are joined into one matrix the first time it is
+        needed after an append.
+        """
+        
+        if not self._chunks:
+            return None
+        if len(self._chunks) > 1:
+            self._chunks = [np.concatenate(self._chunks)]
+        return self._chunks[0]
+
+    def _iter_codes(self, start=0):
+        """
+        Walks the stored code matrix one chunk at a time.
+        
+        Chunks held in memory come out whole, so each is counted in one
+        pass; memory-mapped chunks come out in slices of ``_FOLD_ROLLS``
+        rows so only one slice is paged in at a time.
+        
+        Parameters:
+            start: int, optional
+                First row to return (default is 0).
+            
+        Yields:
+            tuple: The offset of the slice's first row and the slice.
+        """
+        
+        offset = 0
+        for chunk in self._chunks:
+            first = max(start - offset, 0)
+            step = _FOLD_ROLLS if isinstance(chunk, np.memmap) else max(len(chunk), 1)
+            for row in range(first, len(chunk), step):
+                yield offset + row, chunk[row:row + step]
+            offset += len(chunk)
+
+    @property
+    def results(self):
+        """
+        DataFrame of the most recent play, or None before the first play.
+        
+        Built from the code matrix on first access and cached until the
+        next play. Rolls are numbered from 1.
+        """
+        
+        if not self._chunks:
+            return None
+        if self._frame is None:
+            n_rolls, n_dice = self._codes.shape
+            self._frame = pd.DataFrame(self._faces[self._codes],
+                                       index=pd.RangeIndex(1, n_rolls + 1),
+                                       columns=[f'die_{i}' for i in range(n_dice)])
+        return self._frame
+        
+    def play(self, n_rolls, out=None, workers=None, backend='process', path=None,
+             append=False, checkpoint=None, checkpoint_every=1 << 24):
+        """
+        Rolls all dice a given number of time and records the results.
+        
+        Rolls are drawn in fixed-size blocks, each from its own seed
+        spawned off the game's generator, so a seeded game gives the
+        same results whatever the number of workers.
+        
+        Parameters
+            n_rolls: int
+                The number of times to roll all the dice.
+            out: numpy.ndarray, optional
+                Caller-owned integer array of shape (n_rolls, number of
+                dice), wide enough for every face position, that
+                receives the face position of every roll; a
+                memmap or shared memory view works too. The game keeps
+                it as its result store.
+            workers: int, optional
+                Number of workers to spread the blocks over (default is
+                to sample in this thread).
+            backend: str, optional
+                'process' for a process pool or 'thread' for a thread
+                pool filling the result in place, which avoids process
+                startup and pickling costs (default is 'process').
+            path: str, optional
+                ``.npy`` file to hold the code matrix as a memory map, so
+                results can outgrow memory. The dice are saved next to
+                it, and ``Game.open(path)`` reopens the results. The
+                faces must be numbers or strings, not Python objects.
+            append: bool, optional
+                Add the rolls to the stored results as a new chunk
+                instead of replacing them (default is False). Nothing
+                already stored is copied, and analyzers of this game keep
+                their statistics for the earlier rolls.
+            checkpoint: str, optional
+                Folder to checkpoint the play into. It records the dice,
+                the random state and every finished stretch of rolls, so
+                ``Game.resume(checkpoint)`` can finish a killed play with
+                exactly the results it would have had.
+            checkpoint_every: int, optional
+                Rolls between checkpoints, rounded up to whole blocks of
+                65536 (default is 16777216).
+            
+        Returns:
+            None: Results are stored in a private code matrix.
+            
+        Raises:
+            ValueError: If the dice do not share the same faces, out
+                has the wrong shape or is not an integer array wide
+                enough for every face code, both
+                out and path are given, path is given for object faces, path or checkpoint is combined with append,
+                backend is not 'process' or 'thread', the faces or
+                number of dice changed since the results being appended
+                to, or a checkpoint is asked of a generator that was not
+                seeded through a SeedSequence.
+            
+        """
+        
+        faces, weights = self._aligned_weights()
+        append = append and bool(self._chunks)
+        if append:
+            if path is not None or checkpoint is not None:
+                raise ValueError("path and checkpoint cannot be combined with append")
+            if (len(self.dice) != self._chunks[0].shape[1]
+                    or not np.array_equal(faces, self._faces)):
+                raise ValueError("Appended rolls must use the same faces and number of dice")
+        shape = (n_rolls, len(self.dice))
+        if path is not None:
+            if out is not None:
+                raise ValueError("Give either out or path, not both")
+            if faces.dtype.hasobject:
+                raise ValueError("path needs numeric or string faces; object faces cannot be saved without pickling")
+            np.savez(_dice_path(path), faces=faces, weights=weights)
+            out = np.lib.format.open_memmap(path, mode='w+', shape=shape,
+                                            dtype=_code_dtype(len(faces)))
+        if out is None:
+            out = np.empty(shape, dtype=_code_dtype(len(faces)))
+        elif out.shape != shape or not _holds_codes(out.dtype, len(faces)):
+            raise ValueError(f"out must be an integer array of shape {shape} that holds every face code")
+
+        sample = partial(_sample_codes, _stacked_cdf(weights))
+        if checkpoint is None:
+            seeds = _spawn_seeds(self._rng, -(-n_rolls // _BLOCK_ROLLS))
+            _run_blocks(sample, seeds, out, workers, backend)
+        else:
+            seed_seq = self._rng.bit_generator.seed_seq
+            if not isinstance(seed_seq, np.random.SeedSequence):
+                raise ValueError("A checkpointed play needs a generator seeded through a SeedSequence")
+            state = _jsonable({'n_rolls': n_rolls,
+                               'dtype': out.dtype.str,
+                               'path': None if path is None else os.path.abspath(path),
+                               'faces': faces.tolist(),
+                               'weights': weights.tolist(),
+                               'seed': {'entropy': seed_seq.entropy,
+                                        'spawn_key': list(seed_seq.spawn_key),
+                                        'pool_size': seed_seq.pool_size,
+                                        'first_block': seed_seq.n_children_spawned},
+                               'rng': self._rng.bit_generator.state,
+                               'chunks': [],
+                               'rows_done': 0,
+                               'checkpoint_every': checkpoint_every})
+            seeds = _spawn_seeds(self._rng, -(-n_rolls // _BLOCK_ROLLS))
+            os.makedirs(checkpoint, exist_ok=True)
+            _write_checkpoint(checkpoint, state)
+            self._run_checkpointed(sample, seeds, out, state, checkpoint, workers, backend)
+        self._store(out, faces, weights, append)
+
+    def _run_checkpointed(self, sample, seeds, out, state, folder, workers, backend):
+        """
+        Fills out stretch by stretch from where state left off, recording
+        each finished stretch and the updated state in the checkpoint folder.
+        
+        A memory-mapped out is its own record: it is flushed and only the
+        rows done are noted. Otherwise each stretch is saved as a chunk
+        file. Once the play is done the chunk files are removed and the
+        state is marked finished.
+        """
+        
+        every = max(1, -(-state['checkpoint_every'] // _BLOCK_ROLLS))
+        first = state['rows_done'] // _BLOCK_ROLLS
+        for start in range(first, len(seeds), every):
+            stop = min(start + every, len(seeds))
+            rows = out[start * _BLOCK_ROLLS:stop * _BLOCK_ROLLS]
+            _run_blocks(sample, seeds[start:stop], rows, workers, backend)
+            if isinstance(out, np.memmap):
+                out.flush()
+            else:
+                name = f'chunk_{len(state["chunks"]):06d}.npy'
+                _atomic_save(os.path.join(folder, name), rows)
+                state['chunks'].append(name)
+            state['rows_done'] += len(rows)
+            _write_checkpoint(folder, state)
+        names, state['chunks'] = state['chunks'], []
+        state['finished'] = True
+        _write_checkpoint(folder, state)
+        for name in names:
+            os.remove(os.path.join(folder, name))
+
+    def _store(self, out, faces, weights, append):
+        """
+        Keeps a freshly played code matrix as the game's results, along
+        with the faces and weights that produced it.
+        """
+        
+        if isinstance(out, np.memmap):
+            out.flush()
+        if append:
+            self._chunks.append(out)
+        else:
+            self._chunks = [out]
+            self._generation += 1
+        self._faces = faces
+        self._weights = weights
+        self._frame = None
+        self._narrow = None
+
+    @classmethod
+    def resume(cls, checkpoint, workers=None, backend='process'):
+        """
+        Finishes a play that was checkpointed with ``play(checkpoint=...)``.
+        
+        The dice, the random state and the finished rolls are restored
+        from the folder, and the remaining blocks are drawn from the same
+        seeds the original play would have used, so the results match an
+        uninterrupted play. Progress keeps being checkpointed. A play made
+        with ``path`` is finished in place in its memory-mapped file, which
+        can also be resumed after it finished.
+        
+        Parameters:
+            checkpoint: str
+                The checkpoint folder.
+            workers: int, optional
+                Number of workers for the remaining blocks.
+            backend: str, optional
+                'process' or 'thread' (default is 'process').
+            
+        Returns:
+            Game: The game with the finished play as its results.
+            
+        Raises:
+            ValueError: If the play finished in memory, so its results
+                are gone, or its results file no longer matches the play.
+        """
+        
+        with open(os.path.join(checkpoint, 'state.json')) as file:
+            state = json.load(file)
+        if state.get('finished') and state.get('path') is None:
+            raise ValueError("The checkpointed play already finished in memory; its results were not kept")
+        seed = state['seed']
+        n_blocks = -(-state['n_rolls'] // _BLOCK_ROLLS)
+        seeds = [np.random.SeedSequence(seed['entropy'],
+                                        spawn_key=tuple(seed['spawn_key']) + (seed['first_block'] + i,),
+                                        pool_size=seed['pool_size'])
+                 for i in range(n_blocks)]
+        # later plays carry on from where the original play left the stream#
+        seed_seq = np.random.SeedSequence(seed['entropy'],
+                                          spawn_key=tuple(seed['spawn_key']),
+                                          pool_size=seed['pool_size'],
+                                          n_children_spawned=seed['first_block'] + n_blocks)
+        bit_generator = getattr(np.random, state['rng']['bit_generator'])(seed_seq)
+        bit_generator.state = state['rng']
+
+        faces = np.array(state['faces'])
+        weights = np.array(state['weights'])
+        game = cls(_dice_from_weights(faces, weights), rng=np.random.Generator(bit_generator))
+        shape = (state['n_rolls'], len(weights))
+        if state.get('path') is None:
+            out = np.empty(shape, dtype=np.dtype(state['dtype']))
+        else:
+            out = np.lib.format.open_memmap(state['path'], mode='r+')
+            if out.shape != shape or out.dtype != np.dtype(state['dtype']):
+                raise ValueError("The results file does not match the checkpointed play")
+        done = 0
+        for name in state['chunks']:
+            chunk = np.load(os.path.join(checkpoint, name), mmap_mode='r')
+            out[done:done + len(chunk)] = chunk
+            done += len(chunk)
+        sample = partial(_sample_codes, _stacked_cdf(weights))
+        game._run_checkpointed(sample, seeds, out, state, checkpoint, workers, backend)
+        game._store(out, game.dice[0]._faces, weights, append=False)
+        return game
+
+    @classmethod
+    def open(cls, path, mode='r', rng=None):
+        """
+        Reopens results written by ``play(n_rolls, path=...)``.
+        
+        The code matrix is memory mapped rather than read, so opening is
+        instant and nothing is parsed; pass the game to ``Analyzer`` to
+        analyze it.
+        
+        Parameters:
+            path: str
+                The ``.npy`` results file.
+            mode: str, optional
+                Memory map mode, 'r' or 'r+' (default is 'r').
+            rng: int, numpy.random.SeedSequence or numpy.random.Generator, optional
+                Seed or generator for any later plays.
+            
+        Returns:
+            Game: A game holding the saved dice and results.
+        """
+        
+        with np.load(_dice_path(path)) as saved:
+            faces, weights = saved['faces'], saved['weights']
+        game = cls(_dice_from_weights(faces, weights), rng=rng)
+        game._chunks = [np.load(path, mmap_mode=mode)]
+        game._faces = game.dice[0]._faces
+        game._weights = weights
+        return game
+
+    def to_arrow(self):
+        """
+        Returns the results as an Apache Arrow table.
+        
+        Each die is a dictionary-encoded column whose indices are the
+        stored face codes and whose dictionary is the face table, so no
+        face values are repeated. The faces and weights the results were
+        rolled with (those of the latest play, after an append) are kept
+        in the schema metadata for ``Game.from_arrow``.
+        
+        Returns:
+            pyarrow.Table: One column per die, one row per roll.
+            
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ValueError: If no games have been played.
+        """
+        
+        pa, _ = _import_pyarrow()
+        if not self._chunks:
+            raise ValueError("No games have been played yet")
+
+        schema = self._arrow_schema(pa)
+        batches = [self._arrow_batch(pa, schema, codes) for codes in self._chunks]
+        return pa.Table.from_batches(batches, schema=schema)
+
+    def to_parquet(self, path, row_group_size=1 << 20):
+        """
+        Writes the results to a Parquet file.
+        
+        Columns are dictionary encoded as in ``to_arrow``, and the file is
+        written one row group at a time, so only one group's worth of
+        Arrow arrays is held in memory.
+        
+        Parameters:
+            path: str
+                The Parquet file to write.
+            row_group_size: int, optional
+                Rolls per row group (default is 1048576).
+            
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ValueError: If no games have been played.
+        """
+        
+        pa, pq = _import_pyarrow()
+        if not self._chunks:
+            raise ValueError("No games have been played yet")
+
+        schema = self._arrow_schema(pa)
+        with pq.ParquetWriter(path, schema) as writer:
+            for chunk in self._chunks:
+                for start in range(0, len(chunk), row_group_size):
+                    batch = self._arrow_batch(pa, schema, chunk[start:start + row_group_size])
+                    writer.write_batch(batch, row_group_size=row_group_size)
+
+    def _arrow_schema(self, pa):
+        """
+        Builds the Arrow schema of the results, with the faces and weights
+        of the dice that rolled them as metadata.
+        """
+        
+        faces, weights = self._faces, self._weights
+        index_type = pa.from_numpy_dtype(np.promote_types(_code_dtype(len(faces)), np.int8))
+        face_type = pa.array(faces).type
+        fields = [pa.field(f'die_{i}', pa.dictionary(index_type, face_type))
+                  for i in range(self._chunks[0].shape[1])]
+        dice = {'faces': faces.tolist(), 'weights': weights.tolist()}
+        return pa.schema(fields, metadata={'mc_sim.dice': json.dumps(dice)})
+
+    def _arrow_batch(self, pa, schema, codes):
+        """
+        Wraps a slice of the code matrix as a dictionary-encoded record batch.
+        """
+        
+        dictionary = pa.array(self._faces)
+        index_dtype = schema.field(0).type.index_type.to_pandas_dtype()
+        columns = [pa.DictionaryArray.from_arrays(codes[:, i].astype(index_dtype), dictionary)
+                   for i in range(codes.shape[1])]
+        return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    @classmethod
+    def from_arrow(cls, table, rng=None):
+        """
+        Rebuilds a game from a table written by ``to_arrow``.
+        
+        Codes are read from the dictionary indices batch by batch, without
+        building any pandas columns, and each batch becomes one chunk of
+        the game's results.
+        
+        Parameters:
+            table: pyarrow.Table
+                Results with the dice in the schema metadata.
+            rng: int, numpy.random.SeedSequence or numpy.random.Generator, optional
+                Seed or generator for any later plays.
+            
+        Returns:
+            Game: A game holding the saved dice and results.
+            
+        Raises:
+            ValueError: If the table has no saved dice or holds faces that
+                are not on them.
+        """
+        
+        return cls._from_batches(table.schema, table.to_batches(), rng)
+
+    @classmethod
+    def from_parquet(cls, path, rng=None):
+        """
+        Rebuilds a game from a Parquet file written by ``to_parquet``.
+        
+        The file is read one row group at a time; pass the game to
+        ``Analyzer`` to analyze it.
+        
+        Parameters:
+            path: str
+                The Parquet file to read.
+            rng: int, numpy.random.SeedSequence or numpy.random.Generator, optional
+                Seed or generator for any later plays.
+            
+        Returns:
+            Game: A game holding the saved dice and results.
+            
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ValueError: If the file has no saved dice or holds faces that
+                are not on them.
+        """
+        
+        _, pq = _import_pyarrow()
+        source = pq.ParquetFile(path)
+        batches = (source.read_row_group(i).combine_chunks().to_batches()
+                   for i in range(source.num_row_groups))
+        return cls._from_batches(source.schema_arrow,
+                                 (batch for group in batches for batch in group), rng)
+
+    @classmethod
+    def _from_batches(cls, schema, batches, rng):
+        """
+        Builds a game from Arrow record batches and their schema metadata.
+        """
+        
+        metadata = schema.metadata or {}
+        if b'mc_sim.dice' not in metadata:
+            raise ValueError("The results do not include their dice")
+        dice = json.loads(metadata[b'mc_sim.dice'])
+        game = cls(_dice_from_weights(np.array(dice['faces']), np.array(dice['weights'])), rng=rng)
+        faces = game.dice[0]._faces
+        dtype = _code_dtype(len(faces))
+        game._chunks = [_batch_codes(batch, game.dice[0]._index, dtype)
+                        for batch in batches if batch.num_rows]
+        if not game._chunks:
+            game._chunks = [np.empty((0, len(game.dice)), dtype=dtype)]
+        game._faces = faces
+        game._weights = np.array(dice['weights'])
+        return game
+        
+    def play_iter(self, n_rolls, chunk_size=_BLOCK_ROLLS):
+        """
+        Rolls all dice n_rolls times, yielding the results in chunks.
+        
+        Chunks are code matrices: entry (i, j) is the position of die j's
+        face in the face table (the first die's faces). They are drawn
+        from the same seeded blocks as ``play``, so a seeded game yields
+        exactly the rows ``play`` would have stored. Nothing is stored on
+        the game, and every chunk is written into the same buffer: it is
+        only valid until the next one is requested. Feed the chunks to
+        ``Analyzer(game, chunks=...)`` to analyze runs larger than memory.
+        
+        Parameters:
+            n_rolls: int
+                The number of times to roll all the dice.
+            chunk_size: int, optional
+                Rolls per chunk (default is 65536). The last chunk may be
+                shorter.
+            
+        Yields:
+            numpy.ndarray: The next (chunk rows, n_dice) code matrix.
+            
+        Raises:
+            ValueError: If the dice do not share the same faces or
+                chunk_size is not positive.
         """
-        Initialize a new dice game.
+        
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        faces, weights = self._aligned_weights()
+        sample = partial(_sample_codes, _stacked_cdf(weights))
+        seeds = _spawn_seeds(self._rng, -(-n_rolls // _BLOCK_ROLLS))
+        buffer = np.empty((min(n_rolls, chunk_size), len(self.dice)),
+                          dtype=_code_dtype(len(faces)))
+        done = 0
+        block = None
+        while done < n_rolls:
+            chunk = buffer[:min(chunk_size, n_rolls - done)]
+            filled = 0
+            # a chunk may start or end part way through a block#
+            while filled < len(chunk):
+                row = done + filled
+                if row // _BLOCK_ROLLS != block:
+                    block = row // _BLOCK_ROLLS
+                    rng = np.random.default_rng(seeds[block])
+                take = min(len(chunk) - filled, (block + 1) * _BLOCK_ROLLS - row)
+                sample(rng, take, out=chunk[filled:filled + take])
+                filled += take
+            done += len(chunk)
+            yield chunk
 
+    async def play_async(self, n_rolls, executor=None, **kwargs):
+        """
+        Runs ``play`` in an executor so the event loop stays responsive.
+        
+        The play has to store its results on this game, so it runs in a
+        thread; pass ``workers`` and ``backend='process'`` to spread the
+        sampling itself over processes.
+        
         Parameters:
-            dice : list
-                 A list of Die objects to be used in the game.
-
+            n_rolls: int
+                The number of times to roll all the dice.
+            executor: concurrent.futures.ThreadPoolExecutor, optional
+                Where to run the play (default is the loop's default
+                thread pool).
+            **kwargs:
+                Any other ``play`` arguments, e.g. workers or append.
+            
         Returns:
-            None
+            None: Results are stored as by ``play``.
             
+        Raises:
+            ValueError: If executor is not a thread pool.
         """
-
-        self.dice = dice
-        self.results = None
         
-    def play(self, n_rolls):
+        _check_executor(executor)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, partial(self.play, n_rolls, **kwargs))
+
+    async def play_iter_async(self, n_rolls, chunk_size=_BLOCK_ROLLS, executor=None):
         """
-        Rolls all dice a given number of time and records the results.
+        Async iterator over the chunks of ``play_iter``.
         
-        Parameters
+        Each chunk is drawn in an executor while the event loop carries
+        on. As with ``play_iter``, a chunk is only valid until the next
+        one is requested.
+        
+        Parameters:
             n_rolls: int
                 The number of times to roll all the dice.
+            chunk_size: int, optional
+                Rolls per chunk (default is 65536).
+            executor: concurrent.futures.ThreadPoolExecutor, optional
+                Where to draw the chunks (default is the loop's default
+                thread pool).
             
+        Yields:
+            numpy.ndarray: The next (chunk rows, n_dice) code matrix.
+            
+        Raises:
+            ValueError: If executor is not a thread pool.
+        """
+        
+        _check_executor(executor)
+        loop = asyncio.get_running_loop()
+        chunks = self.play_iter(n_rolls, chunk_size)
+        while True:
+            chunk = await loop.run_in_executor(executor, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    def _aligned_weights(self):
+        """
+        Lines every die's weights up against one shared face table.
+        
         Returns:
-            None: Results are stored in a private data frame.
+            tuple: The face table (the first die's faces) and a weight
+            matrix of shape (n_dice, n_faces) in that face order.
             
+        Raises:
+            ValueError: If the dice do not all have the same faces.
+        """
+        
+        return self.dice[0]._faces, _align_weights(self.dice, self.dice[0]._index)
+
+    def _narrow_frame(self):
         """
+        Builds the narrow results frame, one row per die per roll.
+        
+        Rows run through every roll of die_0, then die_1 and so on, the
+        same order ``melt`` gives.
         
-        results = {f'die_{i}': die.roll_die(n_rolls) 
-                   for i, die in enumerate(self.dice)}
-        self.results = pd.DataFrame(results, index=[f'roll_{i + 1}' for i in range(n_rolls)])
+        Returns:
+            pandas.DataFrame: Categorical Roll, Die and Face columns; Face
+            holds the plain face values instead when a face is missing
+            (NaN or None), which categories cannot hold.
+        """
         
+        codes = self._codes
+        n_rolls, n_dice = codes.shape
+        roll = pd.Categorical.from_codes(np.tile(np.arange(n_rolls), n_dice),
+                                         categories=pd.RangeIndex(1, n_rolls + 1))
+        die = pd.Categorical.from_codes(np.repeat(np.arange(n_dice), n_rolls),
+                                        categories=[f'die_{i}' for i in range(n_dice)])
+        if pd.isna(self._faces).any():
+            face = self._faces[codes.T.ravel()]
+        else:
+            face = pd.Categorical.from_codes(codes.T.ravel(), categories=self._faces)
+        return pd.DataFrame({'Roll': roll, 'Die': die, 'Face': face})
+
     def show(self, form = 'wide'):
         """
         Returns a copy of the private play data frame to the user.
@@ -170,7 +1614,10 @@ class Game():
             form : str, optional
                 Format of the results, either 'wide' or 'narrow' (default is 'wide')
                     - 'wide': Each die roll is a column
-                    - 'narrow': Results are melted into a long format with die number and outcome columns
+                    - 'narrow': Results are melted into a long format with die number and outcome columns.
+                      Roll, Die and Face are Categorical columns built straight from the code matrix.
+                Either frame is cached until the next play; the narrow one
+                is handed out as a copy of the cache.
 
         Returns:
             pandas.DataFrame
@@ -181,42 +1628,246 @@ class Game():
                 If no games have been played or if form is not 'wide' or 'narrow'
                 
         """
-        if self.results is None:
+        if not self._chunks:
             raise ValueError("No games have been played yet")
 
         if form == 'wide':
             return self.results
         elif form == 'narrow':
-            narrow = self.results.copy()
-            narrow.index.name = 'Roll'  # Name the index first
-            narrow = narrow.reset_index().melt(id_vars=['Roll'], var_name='Die', value_name='Face')
-            return narrow
+            if self._narrow is None:
+                self._narrow = self._narrow_frame()
+            return self._narrow.copy()
         else:
             raise ValueError("form must be 'wide' or 'narrow'")
+
+
+def _jackpot_mask(codes):
+    """
+    Flags the rolls of a code matrix where every die shows the same face.
+    
+    Every die (the last axis) is compared against the first one in turn,
+    folding into a single mask, so it also works on a batch of games and
+    never builds a full boolean copy of the codes.
+    """
+    
+    first = codes[..., 0]
+    mask = np.ones(first.shape, dtype=bool)
+    for i in range(1, codes.shape[-1]):
+        mask &= codes[..., i] == first
+    return mask
+
+
+def _face_count_matrix(codes, n_faces):
+    """
+    Counts how often each face appears in each roll of a code matrix.
+    
+    Every roll gets its own run of n_faces bins, so one np.bincount over
+    the offset codes counts all rolls at once. Leading axes (such as a
+    batch of games) are kept.
+    
+    Returns:
+        numpy.ndarray: Counts of shape codes.shape[:-1] + (n_faces,),
+        faces in die order.
+    """
+    
+    rolls = codes.reshape(-1, codes.shape[-1])
+    bins = rolls + (np.arange(len(rolls)) * n_faces)[:, None]
+    counts = np.bincount(bins.ravel(), minlength=len(rolls) * n_faces)
+    return counts.reshape(codes.shape[:-1] + (n_faces,))
+
+
+def _pack_rows(codes, n_faces):
+    """
+    Encodes every roll of a code matrix as one mixed-radix int64 key,
+    code_0 + n_faces * code_1 + n_faces**2 * code_2 + ...
+    
+    Returns:
+        numpy.ndarray or None: One key per roll, or None when
+        n_faces ** n_dice does not fit in 64 bits.
+    """
+    
+    n_dice = codes.shape[-1]
+    if n_faces ** n_dice > np.iinfo(np.int64).max:
+        return None
+    keys = np.zeros(codes.shape[:-1], dtype=np.int64)
+    for i in reversed(range(n_dice)):
+        keys *= n_faces
+        keys += codes[..., i]
+    return keys
+
+
+def _unpack_keys(keys, n_faces, n_dice):
+    """
+    Decodes mixed-radix keys from ``_pack_rows`` back into code rows.
+    """
+    
+    return keys[:, None] // n_faces ** np.arange(n_dice, dtype=np.int64) % n_faces
+
+
+def _rank_table(n_faces, n_dice):
+    """
+    Builds the combinatorial number system table for sorted rolls:
+    entry [i, c] is C(c + i, i + 1), the rank a die at position i
+    showing code c contributes.
+    """
+    
+    return np.array([[math.comb(c + i, i + 1) for c in range(n_faces)]
+                     for i in range(n_dice)], dtype=np.int64)
+
+
+def _rank_combos(rows, n_faces):
+    """
+    Ranks sorted code rows as multisets: the roll c_0 <= c_1 <= ...
+    maps to sum C(c_i + i, i + 1), a dense index in
+    [0, C(n_faces + n_dice - 1, n_dice)).
+    """
+    
+    table = _rank_table(n_faces, rows.shape[1])
+    ranks = np.zeros(len(rows), dtype=np.int64)
+    for i in range(rows.shape[1]):
+        ranks += table[i, rows[:, i]]
+    return ranks
+
+
+def _unrank_combos(ranks, n_faces, n_dice):
+    """
+    Decodes multiset ranks from ``_rank_combos`` back into sorted code rows.
+    """
+    
+    table = _rank_table(n_faces, n_dice)
+    rows = np.empty((len(ranks), n_dice), dtype=np.int64)
+    ranks = ranks.copy()
+    for i in reversed(range(n_dice)):
+        rows[:, i] = np.searchsorted(table[i], ranks, side='right') - 1
+        ranks -= table[i, rows[:, i]]
+    return rows
+
+
+def _combo_counts(codes, n_faces):
+    """
+    Counts the distinct order-independent combinations in a code matrix.
+    
+    Rolls are sorted along the dice axis. When there are at most
+    ``_DENSE_KEYS`` multisets, C(n_faces + n_dice - 1, n_dice), each
+    sorted roll is ranked with the combinatorial number system and the
+    ranks are counted with one np.bincount into a dense array. Otherwise
+    the sorted rows are packed into int64 keys and counted with
+    np.unique; if the keys would overflow, the rows themselves are.
+    
+    Returns:
+        numpy.ndarray or tuple: Dense counts indexed by rank, or the
+        distinct keys (or rows) and their counts.
+    """
+    
+    rows = np.sort(codes, axis=1)
+    n_combos = math.comb(n_faces + codes.shape[1] - 1, codes.shape[1])
+    if n_combos <= _DENSE_KEYS:
+        return np.bincount(_rank_combos(rows, n_faces), minlength=n_combos)
+    keys = _pack_rows(rows, n_faces)
+    if keys is None:
+        keys = rows
+    return np.unique(keys, axis=0, return_counts=True)
+
+
+def _perm_counts(codes, n_faces):
+    """
+    Counts the distinct order-dependent permutations in a code matrix.
+    
+    Rolls are packed into mixed-radix int64 keys. When there are at most
+    ``_DENSE_KEYS`` possible keys they are counted with one np.bincount
+    into a dense array, otherwise with np.unique. Only when the keys
+    would overflow 64 bits are the rows themselves counted instead.
+    
+    Returns:
+        numpy.ndarray or tuple: Dense counts indexed by key, or the
+        distinct keys (or rows) and their counts.
+    """
+    
+    keys = _pack_rows(codes, n_faces)
+    if keys is None:
+        return np.unique(codes, axis=0, return_counts=True)
+    n_keys = n_faces ** codes.shape[1]
+    if n_keys <= _DENSE_KEYS:
+        return np.bincount(keys, minlength=n_keys)
+    return np.unique(keys, return_counts=True)
+
+
+def _merge_counts(total, counts):
+    """
+    Adds one chunk's counts into a running total of the same kind: a
+    dense count array, or a (keys, counts) pair.
+    
+    Sorted int64 keys are merged without re-sorting the running total:
+    the chunk's keys are located with searchsorted, the counts of keys
+    already present are added in place and the new ones are inserted.
+    Only the rare overflow case of raw rows is merged with np.unique.
+    """
+    
+    if total is None:
+        return counts
+    if isinstance(counts, np.ndarray):
+        return total + counts
+    if total[0].ndim == 1:
+        keys, totals = total
+        position = np.searchsorted(keys, counts[0])
+        found = position < len(keys)
+        found[found] = keys[position[found]] == counts[0][found]
+        totals = totals.copy()
+        np.add.at(totals, position[found], counts[1][found])
+        new = ~found
+        return (np.insert(keys, position[new], counts[0][new]),
+                np.insert(totals, position[new], counts[1][new]))
+    keys = np.concatenate([total[0], counts[0]])
+    unique, position = np.unique(keys, axis=0, return_inverse=True)
+    merged = np.bincount(position.ravel(), weights=np.concatenate([total[1], counts[1]]))
+    return unique, merged.astype(np.int64)
+
+
+# running statistics an analyzer keeps, and those a stream can keep#
+_STATISTICS = ('jackpot', 'face_totals', 'face_counts', 'combos', 'perms')
+_STREAMED_STATISTICS = ('jackpot', 'face_totals', 'combos', 'perms')
+# what to ask a stream for instead of the per-roll statistics it does not keep#
+_UNSTREAMED = {'jackpot_rolls': "Jackpot roll numbers are not kept for streamed chunks; use jackpot.",
+               'face_counts': "Per-roll face counts are not kept for streamed chunks; use face_totals."}
+
+
 class Analyzer:
     """
     A class to anlayze the results of single game and computes various descriptive statistical properties about it.
     
     Provides methods to compute jackpots, face counts, combinations, and permutations of rolled dice. 
+    Statistics are kept as running tallies. An analyzer of a played game follows the game's
+    stored results, so rolls added with ``play(n_rolls, append=True)`` are folded into the
+    tallies without recounting the earlier ones; an analyzer built from streamed chunks
+    of ``Game.play_iter`` tallies those chunks instead.
     
 
     Methods:
         jackpot(): Returns the number of rolls that resulted in all dice showing the same face
+        jackpot_rolls(): Returns the roll numbers of those rolls
         face_counts(): Returns a DataFrame showing the count of each face value per roll
+        face_totals(): Returns how many times each face was rolled over all rolls
         combo_count(): Returns counts of unique combinations of faces (order doesn't matter)
         permu_count(): Returns counts of unique permutations of faces (order matters)
+        update(codes): Folds one chunk of coded results into the running tallies
         
     """    
     
-    def __init__(self, game):
+    def __init__(self, game, chunks=None):
         """
         Initializes the analyzer with a game object.
         
         Parameters:
             Game: A  Game objec that has been played.
+            chunks: iterable, optional
+                Code matrix chunks, e.g. from ``game.play_iter``. When
+                given, the analyzer keeps running tallies over the chunks
+                instead of reading the game's stored results, and the
+                game does not need to have been played.
             
         Raises:
-            ValueError: If the passed value is not a Game object.
+            ValueError: If the passed value is not a Game object, or no
+                chunks are given and the game has not been played.
             
         """
         
@@ -224,7 +1875,104 @@ class Analyzer:
             raise ValueError("Input must be a Game object.")
             
         self.game = game
-        self._results = game.show(form='wide')
+        self._faces = game.dice[0]._faces
+        self._streamed = chunks is not None
+        self._reset()
+        if not self._streamed:
+            if not game._chunks:
+                raise ValueError("No games have been played yet")
+            self._generation = game._generation
+        else:
+            for codes in chunks:
+                self.update(codes)
+
+    def _reset(self):
+        """
+        Empties every running tally.
+        """
+        
+        self._n_rolls = 0
+        self._rows = dict.fromkeys(_STATISTICS, 0)
+        self._tallies = {'jackpot': 0,
+                         'jackpot_rolls': [],
+                         'face_totals': np.zeros(len(self._faces), dtype=np.int64),
+                         'face_counts': [],
+                         'combos': None,
+                         'perms': None}
+
+    def update(self, codes):
+        """
+        Folds one chunk of coded results into the running tallies.
+        
+        Parameters:
+            codes: numpy.ndarray
+                A (rolls, n_dice) code matrix as yielded by
+                ``Game.play_iter``. It is not kept.
+            
+        Raises:
+            ValueError: If the analyzer reads its game's stored results.
+        """
+        
+        if not self._streamed:
+            raise ValueError("This analyzer reads its game's results; pass chunks to a new Analyzer instead.")
+
+        for name in _STREAMED_STATISTICS:
+            self._fold(name, codes, self._n_rolls)
+        self._n_rolls += len(codes)
+
+    def _fold(self, name, codes, offset):
+        """
+        Adds one chunk's share of a statistic to its running tally.
+        
+        Parameters:
+            name: str
+                The statistic.
+            codes: numpy.ndarray
+                The chunk's code matrix.
+            offset: int
+                Number of rolls before the chunk.
+        """
+        
+        tallies = self._tallies
+        if name == 'jackpot':
+            # one mask gives both the count and, for stored games, the rolls#
+            mask = _jackpot_mask(codes)
+            tallies['jackpot'] += int(np.count_nonzero(mask))
+            if not self._streamed:
+                tallies['jackpot_rolls'].append(offset + 1 + np.flatnonzero(mask))
+        elif name == 'face_totals':
+            tallies[name] += np.bincount(codes.ravel(), minlength=len(self._faces))
+        elif name == 'face_counts':
+            tallies[name].append(_face_count_matrix(codes, len(self._faces)))
+        elif name == 'combos':
+            tallies[name] = _merge_counts(tallies[name], _combo_counts(codes, len(self._faces)))
+        else:
+            tallies[name] = _merge_counts(tallies[name], _perm_counts(codes, len(self._faces)))
+
+    def _statistic(self, name):
+        """
+        Returns a running statistic, first folding in any rows the game
+        has stored since it was last asked for.
+        
+        Raises:
+            ValueError: If the statistic is not kept for streamed chunks.
+        """
+        
+        if self._streamed:
+            if name not in _STREAMED_STATISTICS:
+                raise ValueError(_UNSTREAMED[name])
+            return self._tallies[name]
+
+        # a fresh play replaces everything counted so far#
+        if self.game._generation != self._generation:
+            self._reset()
+            self._generation = self.game._generation
+        # the jackpot rolls are folded together with the jackpot count#
+        folded = 'jackpot' if name == 'jackpot_rolls' else name
+        for offset, codes in self.game._iter_codes(self._rows[folded]):
+            self._fold(folded, codes, offset)
+            self._rows[folded] = offset + len(codes)
+        return self._tallies[name]
         
     def jackpot(self):
         """
@@ -235,7 +1983,21 @@ class Analyzer:
             
         """
         
-        return (self._results.nunique(axis=1) == 1).sum()
+        return self._statistic('jackpot')
+
+    def jackpot_rolls(self):
+        """
+        Finds the rolls that resulted in Jackpot.
+        
+        Returns:
+            numpy.ndarray: Roll numbers (counting from 1) of every Jackpot.
+            
+        Raises:
+            ValueError: If the analyzer only has streamed tallies; use jackpot instead.
+            
+        """
+        
+        return np.concatenate([np.zeros(0, dtype=np.intp)] + self._statistic('jackpot_rolls'))
 
     
     def face_counts(self):
@@ -244,10 +2006,31 @@ class Analyzer:
         
         Returns:
             DataFrame: Index of roll numbers, face values as columns, and values show count of each face in that roll. 
+                Every face has a column, in die order, even if it was never rolled.
+            
+        Raises:
+            ValueError: If the analyzer only has streamed tallies; use face_totals instead.
             
         """
         
-        return self._results.apply(pd.Series.value_counts, axis=1).fillna(0).astype(int)
+        counts = self._statistic('face_counts')
+        if len(counts) != 1:
+            # join the chunks once so later calls reuse the joined array#
+            counts[:] = [np.concatenate([np.zeros((0, len(self._faces)), dtype=np.int64)] + counts)]
+        return pd.DataFrame(counts[0], index=pd.RangeIndex(1, len(counts[0]) + 1),
+                            columns=pd.Index(self._faces))
+
+    def face_totals(self):
+        """
+        Computes how many times each face was rolled over all rolls and dice.
+        
+        Returns:
+            Series: Count of each face, indexed by face value in die order.
+            
+        """
+        
+        totals = self._statistic('face_totals')
+        return pd.Series(totals, index=pd.Index(self._faces, name='Face'), name='count')
 
         
     def combo_count(self):
@@ -260,9 +2043,7 @@ class Analyzer:
         
         """
         
-        df = self.game.show('wide')
-        combos = df.apply(lambda x: tuple(sorted(x)), axis=1)
-        return combos.value_counts()
+        return self._decoded_counts(self._statistic('combos'), ranked=True)
     
     def perm_count(self):
         """
@@ -274,6 +2055,288 @@ class Analyzer:
             
         """
         
-        df = self.game.show('wide')
-        perms = df.apply(tuple, axis=1)
-        return perms.value_counts()
\ No newline at end of file
+        return self._decoded_counts(self._statistic('perms'))
+
+    def _decoded_counts(self, counts, ranked=False):
+        """
+        Turns a running dense or (keys, counts) tally into a count Series.
+        
+        Only the distinct keys are decoded into faces, and the MultiIndex
+        is built from those alone. A dense tally is indexed by multiset
+        rank when ``ranked`` is set, otherwise by mixed-radix key. The
+        Series is sorted like ``value_counts`` output.
+        """
+        
+        n_dice = len(self.game.dice)
+        if counts is None:
+            return pd.Series(dtype=np.int64, name='count')
+        if isinstance(counts, np.ndarray):
+            keys = np.flatnonzero(counts)
+            totals = counts[keys]
+            decode = _unrank_combos if ranked else _unpack_keys
+        else:
+            keys, totals = counts
+            decode = _unpack_keys
+        rows = keys if keys.ndim == 2 else decode(keys, len(self._faces), n_dice)
+        index = pd.MultiIndex.from_arrays([self._faces[rows[:, i]] for i in range(n_dice)])
+        counts = pd.Series(totals, index=index, name='count')
+        return counts.sort_values(ascending=False, kind='stable')
+
+
+class GameBatch():
+    """
+    A class to play many independent games with the same faces at once.
+    
+    Every game may have its own dice weights, but all games need the same
+    number of dice and the same faces. A play samples one
+    (n_games, n_rolls, n_dice) tensor in a single vectorized pass instead
+    of looping over Game objects, and the Analyzer statistics are
+    available batched across games.
+    
+    Attributes:
+        games (list): The dice of each game, one list of Die objects per game
+
+    Methods:
+        play(n_rolls): Rolls every game's dice n_rolls times and stores the results
+        game(i): Returns game i's results as a Game, for use with Analyzer
+        jackpot(): Returns the number of jackpots in each game
+        face_counts(): Returns the count of each face in each roll of each game
+        face_totals(): Returns how many times each face was rolled in each game
+        combo_count(): Returns counts of each combination in each game
+        perm_count(): Returns counts of each permutation in each game
+    """
+    
+    def __init__(self, games, rng=None):
+        """
+        Initializes the batch from several game configurations.
+        
+        Parameters:
+            games: list
+                One entry per game, either a Game or a list of Die objects.
+            rng: int, numpy.random.SeedSequence or numpy.random.Generator, optional
+                Seed or generator for the batch's rolls (default is fresh
+                OS entropy).
+            
+        Raises:
+            ValueError: If there are no games, or the games do not all have
+                the same number of dice and the same faces.
+        """
+        
+        self.games = [game.dice if isinstance(game, Game) else list(game) for game in games]
+        if not self.games:
+            raise ValueError("A batch needs at least one game")
+        if len({len(dice) for dice in self.games}) > 1:
+            raise ValueError("All games must have the same number of dice")
+        # faces never change after a die is made, so they are checked once#
+        for dice in self.games:
+            _align_weights(dice, self.games[0][0]._index)
+        self._rng = _as_generator(rng)
+        self._faces = self.games[0][0]._faces
+        self._weights = None
+        self._codes = None
+
+    def play(self, n_rolls):
+        """
+        Rolls every game's dice n_rolls times and stores the results.
+        
+        All games and dice are resolved with one vectorized inverse-CDF
+        search per block of rolls over the stacked cumulative weights of
+        every die in every game.
+        
+        Parameters:
+            n_rolls: int
+                The number of times to roll each game's dice.
+            
+        Raises:
+            ValueError: If a die's faces differ from the others or its
+                weights are all zero.
+        """
+        
+        index = self.games[0][0]._index
+        weights = np.array([_align_weights(dice, index) for dice in self.games])
+        n_games, n_dice, n_faces = weights.shape
+        cdf = _stacked_cdf(weights.reshape(n_games * n_dice, n_faces))
+        # die j of game g searches row g * n_dice + j of the stacked cdf#
+        offsets = np.arange(n_games * n_dice).reshape(n_games, 1, n_dice)
+        codes = np.empty((n_games, n_rolls, n_dice), dtype=_code_dtype(n_faces))
+        for start in range(0, n_rolls, _BLOCK_ROLLS):
+            rows = codes[:, start:start + _BLOCK_ROLLS]
+            _search_codes(cdf, offsets, self._rng.random(rows.shape), out=rows)
+        self._codes = codes
+        self._weights = weights
+
+    def game(self, i):
+        """
+        Returns one game's results as a Game, without copying them.
+        
+        Parameters:
+            i: int
+                Position of the game in the batch.
+            
+        Returns:
+            Game: A played game that can be shown or passed to Analyzer.
+            
+        Raises:
+            ValueError: If the batch has not been played.
+        """
+        
+        codes = self._played()
+        game = Game(self.games[i])
+        game._chunks = [codes[i]]
+        game._faces = self._faces
+        game._weights = self._weights[i]
+        return game
+
+    def _played(self):
+        """
+        Returns the result tensor, raising if there is none yet.
+        """
+        
+        if self._codes is None:
+            raise ValueError("No games have been played yet")
+        return self._codes
+
+    def jackpot(self):
+        """
+        Counts the rolls in each game where every die shows the same face.
+        
+        Returns:
+            Series: Number of jackpots, indexed by game.
+        """
+        
+        codes = self._played()
+        return pd.Series(_jackpot_mask(codes).sum(axis=-1), index=self._game_index(), name='jackpot')
+
+    def face_counts(self):
+        """
+        Counts how often each face appears in each roll of each game.
+        
+        Returns:
+            DataFrame: Index of (game, roll number) pairs, face values as
+            columns, every face in die order.
+        """
+        
+        codes = self._played()
+        n_games, n_rolls, _ = codes.shape
+        counts = _face_count_matrix(codes, len(self._faces))
+        index = pd.MultiIndex.from_product([self._game_index(), pd.RangeIndex(1, n_rolls + 1)],
+                                           names=['Game', 'Roll'])
+        return pd.DataFrame(counts.reshape(n_games * n_rolls, -1), index=index,
+                            columns=pd.Index(self._faces))
+
+    def face_totals(self):
+        """
+        Counts how many times each face was rolled in each game.
+        
+        Returns:
+            DataFrame: One row per game, face values as columns.
+        """
+        
+        codes = self._played()
+        n_games = len(codes)
+        n_faces = len(self._faces)
+        bins = codes.reshape(n_games, -1) + (np.arange(n_games) * n_faces)[:, None]
+        counts = np.bincount(bins.ravel(), minlength=n_games * n_faces)
+        return pd.DataFrame(counts.reshape(n_games, n_faces), index=self._game_index(),
+                            columns=pd.Index(self._faces, name='Face'))
+
+    def combo_count(self):
+        """
+        Counts each order-independent combination of faces in each game.
+        
+        Sorted rolls are ranked as multisets, or packed into int64 keys
+        when there are too many multisets to rank densely, exactly as
+        ``Analyzer.combo_count`` does.
+        
+        Returns:
+            DataFrame: MultiIndex of distinct combos, one column per game.
+        """
+        
+        codes = np.sort(self._played(), axis=-1)
+        n_games, n_rolls, n_dice = codes.shape
+        n_faces = len(self._faces)
+        n_combos = math.comb(n_faces + n_dice - 1, n_dice)
+        if n_combos <= _DENSE_KEYS:
+            ranks = _rank_combos(codes.reshape(-1, n_dice), n_faces).reshape(n_games, n_rolls)
+            return self._key_counts(ranks, n_combos, _unrank_combos)
+        return self._row_counts(codes)
+
+    def perm_count(self):
+        """
+        Counts each order-dependent permutation of faces in each game.
+        
+        Returns:
+            DataFrame: MultiIndex of distinct permutations, one column per game.
+        """
+        
+        return self._row_counts(self._played())
+
+    def _game_index(self):
+        """
+        Returns the index of the games, in batch order.
+        """
+        
+        return pd.RangeIndex(len(self.games), name='Game')
+
+    def _row_counts(self, codes):
+        """
+        Counts the distinct rows of each game's code matrix.
+        
+        Rows are packed into mixed-radix int64 keys as in ``_pack_rows``
+        and counted by ``_key_counts``. Only when the keys of every game
+        would not fit in 64 bits are whole rows tagged with their game
+        and counted with ``np.unique``.
+        """
+        
+        n_games, n_rolls, n_dice = codes.shape
+        n_faces = len(self._faces)
+        keys = _pack_rows(codes, n_faces)
+        if keys is not None and n_games * n_faces ** n_dice <= np.iinfo(np.int64).max:
+            return self._key_counts(keys, n_faces ** n_dice, _unpack_keys)
+        game = np.repeat(np.arange(n_games), n_rolls)
+        tagged = np.column_stack([game, codes.reshape(-1, n_dice)])
+        rows, counts = np.unique(tagged, axis=0, return_counts=True)
+        distinct, position = np.unique(rows[:, 1:], axis=0, return_inverse=True)
+        table = np.zeros((len(distinct), n_games), dtype=np.int64)
+        table[position.ravel(), rows[:, 0]] = counts
+        return self._count_frame(distinct, table)
+
+    def _key_counts(self, keys, n_keys, decode):
+        """
+        Counts the distinct keys of each game.
+        
+        Game g's keys are offset by g * n_keys so one np.bincount (when
+        all games' keys fit ``_DENSE_KEYS``) or one np.unique counts every
+        game at once.
+        
+        Parameters:
+            keys: numpy.ndarray
+                int64 keys of shape (n_games, n_rolls), each below n_keys.
+            n_keys: int
+                Size of the key space.
+            decode: callable
+                ``decode(keys, n_faces, n_dice)`` turns keys back into code rows.
+        """
+        
+        n_games = len(keys)
+        tagged = (keys + (np.arange(n_games, dtype=np.int64) * n_keys)[:, None]).ravel()
+        if n_games * n_keys <= _DENSE_KEYS:
+            counts = np.bincount(tagged, minlength=n_games * n_keys).reshape(n_games, n_keys)
+            distinct = np.flatnonzero(counts.any(axis=0))
+            table = counts[:, distinct].T
+        else:
+            tags, counts = np.unique(tagged, return_counts=True)
+            distinct, position = np.unique(tags % n_keys, return_inverse=True)
+            table = np.zeros((len(distinct), n_games), dtype=np.int64)
+            table[position, tags // n_keys] = counts
+        return self._count_frame(decode(distinct, len(self._faces), self._codes.shape[-1]), table)
+
+    def _count_frame(self, rows, table):
+        """
+        Wraps distinct code rows and their per-game counts as a DataFrame.
+        """
+        
+        n_dice = rows.shape[1]
+        index = pd.MultiIndex.from_arrays([self._faces[rows[:, j]] for j in range(n_dice)],
+                                          names=[f'die_{j}' for j in range(n_dice)])
+        return pd.DataFrame(table, index=index, columns=[f'game_{g}' for g in range(table.shape[1])])
@@ -1,7 +1,14 @@
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+import tempfile
 import unittest
+from unittest import mock
 import numpy as np
 import pandas as pd
-from MC_Sim import Die, Game, Analyzer
+import MC_Sim
+from MC_Sim import Die, Game, Analyzer, GameBatch, _sample_codes, _stacked_cdf
 
 class TestDie(unittest.TestCase):
 
@@ -14,16 +21,118 @@ class TestDie(unittest.TestCase):
         weight = self.die.show_die().loc[3, 'Weight']
         self.assertEqual(weight, 2.0)
 
+    def test_change_weight_missing_face(self):
+        with self.assertRaises(IndexError):
+            self.die.change_weight(7, 2.0)
+
+    def test_change_weights(self):
+        self.die.change_weights({1: 0, 6: 3.5})
+        weights = self.die.show_die()['Weight']
+        self.assertEqual(weights[1], 0.0)
+        self.assertEqual(weights[6], 3.5)
+        self.die.change_weights(pd.Series([2.0, 2.0], index=[2, 3]))
+        self.assertEqual(self.die.show_die().loc[3, 'Weight'], 2.0)
+
+    def test_change_weights_is_atomic(self):
+        with self.assertRaises(ValueError):
+            self.die.change_weights({1: 4.0, 2: -1.0})
+        with self.assertRaises(IndexError):
+            self.die.change_weights({1: 4.0, 9: 1.0})
+        self.assertEqual(self.die.show_die().loc[1, 'Weight'], 1.0)
+
     def test_roll_die(self):
         rolls = self.die.roll_die(5)
         self.assertEqual(len(rolls), 5)
         self.assertTrue(all(r in self.faces for r in rolls))
 
+    def test_roll_die_output(self):
+        faces = self.die.roll_die(50, output='array')
+        self.assertIsInstance(faces, np.ndarray)
+        self.assertTrue(np.isin(faces, self.faces).all())
+        codes = self.die.roll_die(50, output='codes')
+        self.assertTrue(np.issubdtype(codes.dtype, np.integer))
+        self.assertTrue(np.isin(self.die.sides[codes], self.faces).all())
+        with self.assertRaises(ValueError):
+            self.die.roll_die(5, output='tuple')
+
+    def test_roll_die_seeded(self):
+        first = Die(self.faces, rng=42).roll_die(20)
+        second = Die(self.faces, rng=np.random.default_rng(42)).roll_die(20)
+        self.assertEqual(first, second)
+
+    def test_roll_die_zero_weight(self):
+        for face in [1, 2, 4, 5, 6]:
+            self.die.change_weight(face, 0)
+        self.assertEqual(set(self.die.roll_die(100)), {3})
+
+    def test_roll_die_after_change_weight(self):
+        self.die.roll_die(10)
+        self.die.change_weight(6, 0)
+        self.assertNotIn(6, self.die.roll_die(500))
+
+    def test_roll_die_out(self):
+        buffer = np.zeros(8, dtype=self.faces.dtype)
+        result = self.die.roll_die(8, out=buffer)
+        self.assertIs(result, buffer)
+        self.assertTrue(np.isin(buffer, self.faces).all())
+        codes = np.full(8, -1, dtype=np.int16)
+        self.die.roll_die(8, output='codes', out=codes)
+        self.assertTrue(((codes >= 0) & (codes < 6)).all())
+        with self.assertRaises(ValueError):
+            self.die.roll_die(5, out=buffer)
+        with self.assertRaises(ValueError):
+            self.die.roll_die(8, out=np.zeros(8, dtype=np.int8))
+        with self.assertRaises(ValueError):
+            Die(np.arange(300)).roll_die(8, output='codes', out=np.zeros(8, dtype=np.int8))
+
+    def test_roll_die_threads_deterministic(self):
+        one = Die(self.faces, rng=5).roll_die(3 * 65536, output='codes', workers=1)
+        four = Die(self.faces, rng=5).roll_die(3 * 65536, output='codes', workers=4)
+        np.testing.assert_array_equal(one, four)
+
+    def test_iter_rolls(self):
+        chunks = [chunk.copy() for chunk in self.die.iter_rolls(25, chunk_size=10)]
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+        self.assertTrue(all(np.isin(chunk, self.faces).all() for chunk in chunks))
+
+    def test_iter_rolls_reuses_buffer(self):
+        chunks = self.die.iter_rolls(30, chunk_size=10, output='codes')
+        first = next(chunks)
+        second = next(chunks)
+        self.assertTrue(np.shares_memory(first, second))
+
+    def test_samplers_agree_on_support(self):
+        for sampler in ['alias', 'fenwick', 'auto']:
+            die = Die(self.faces, rng=0, sampler=sampler)
+            die.change_weight(2, 0)
+            die.roll_die(10)
+            die.change_weight(5, 0)
+            die.change_weights({6: 0})
+            self.assertEqual(set(die.roll_die(500)), {1, 3, 4})
+
+    def test_fenwick_frequencies(self):
+        die = Die(np.arange(5), rng=1, sampler='fenwick')
+        die.change_weights({0: 1, 1: 2, 2: 3, 3: 0, 4: 4})
+        counts = np.bincount(die.roll_die(100000, output='codes'), minlength=5)
+        np.testing.assert_allclose(counts / 100000, [0.1, 0.2, 0.3, 0.0, 0.4], atol=0.01)
+
+    def test_auto_sampler_switches(self):
+        die = Die(np.arange(1000), rng=2)
+        for face in range(50):
+            die.change_weight(face, 2.0)
+            die.roll_die(1)
+        self.assertEqual(type(die._sampler).__name__, '_FenwickTree')
+
     def test_show_die(self):
         df = self.die.show_die()
         self.assertIsInstance(df, pd.DataFrame)
         self.assertIn('Weight', df.columns)
 
+    def test_show_die_is_a_copy(self):
+        df = self.die.show_die()
+        df.loc[1, 'Weight'] = 5.0
+        self.assertEqual(list(self.die.show_die()['Weight']), [1.0] * 6)
+
 
 class TestGame(unittest.TestCase):
 
@@ -35,6 +144,228 @@ class TestGame(unittest.TestCase):
     def test_play(self):
         self.assertEqual(self.game.results.shape, (5, 3))
 
+    def test_play_seeded(self):
+        dice = [Die(np.array([1, 2, 3])) for _ in range(3)]
+        first, second = Game(dice, rng=7), Game(dice, rng=7)
+        first.play(20)
+        second.play(20)
+        pd.testing.assert_frame_equal(first.show(), second.show())
+
+    def test_play_out(self):
+        buffer = np.full((6, 3), -1, dtype=np.int8)
+        self.game.play(6, out=buffer)
+        faces = np.array([1, 2, 3])[buffer]
+        np.testing.assert_array_equal(self.game.show().to_numpy(), faces)
+        with self.assertRaises(ValueError):
+            self.game.play(5, out=buffer)
+        wide = Game([Die(np.arange(300)) for _ in range(3)])
+        with self.assertRaises(ValueError):
+            wide.play(6, out=buffer)
+
+    def test_play_mixed_weights(self):
+        fair = Die(np.array([1, 2, 3]))
+        loaded = Die(np.array([1, 2, 3]))
+        loaded.change_weights({1: 0, 2: 0})
+        sixes = Die(np.array([3, 2, 1]))
+        sixes.change_weights({3: 0, 2: 0})
+        game = Game([fair, loaded, sixes], rng=3)
+        game.play(200)
+        results = game.show()
+        self.assertEqual(set(results['die_1']), {3})
+        self.assertEqual(set(results['die_2']), {1})
+        self.assertEqual(set(results['die_0']), {1, 2, 3})
+
+    def test_sample_codes_near_one(self):
+        class NearOne:
+            def random(self, shape):
+                return np.full(shape, np.nextafter(1, 0) - 2 ** -50)
+        cdf = _stacked_cdf(np.ones((600, 6)))
+        codes = _sample_codes(cdf, NearOne(), 3)
+        self.assertTrue((codes == 5).all())
+
+    def test_play_unequal_dice(self):
+        game = Game([Die(np.array([1, 2])), Die(np.array([1, 2, 3]))])
+        with self.assertRaises(ValueError):
+            game.play(3)
+
+    def test_play_compact_store(self):
+        self.assertEqual(self.game._codes.dtype, np.uint8)
+        self.assertEqual(list(self.game.results.index), [1, 2, 3, 4, 5])
+        game = Game([Die(np.array([1, 2])), Die(np.array([1, 3]))])
+        with self.assertRaises(ValueError):
+            game.play(3)
+
+    def test_play_workers_deterministic(self):
+        dice = [Die(np.array([1, 2, 3])) for _ in range(3)]
+        dice[0].change_weight(2, 5.0)
+        n_rolls = 2 * 65536 + 100
+        serial, sharded = Game(dice, rng=11), Game(dice, rng=11)
+        serial.play(n_rolls)
+        sharded.play(n_rolls, workers=2)
+        np.testing.assert_array_equal(serial._codes, sharded._codes)
+
+    def test_play_thread_backend(self):
+        dice = [Die(np.array([1, 2, 3])) for _ in range(3)]
+        n_rolls = 3 * 65536
+        serial, threaded = Game(dice, rng=12), Game(dice, rng=12)
+        serial.play(n_rolls)
+        threaded.play(n_rolls, workers=3, backend='thread')
+        np.testing.assert_array_equal(serial._codes, threaded._codes)
+        with self.assertRaises(ValueError):
+            threaded.play(5, workers=2, backend='fiber')
+
+    def test_play_iter_matches_play(self):
+        dice = [Die(np.array([1, 2, 3])) for _ in range(3)]
+        stored, streamed = Game(dice, rng=13), Game(dice, rng=13)
+        n_rolls = 65536 + 500
+        stored.play(n_rolls)
+        chunks = [chunk.copy() for chunk in streamed.play_iter(n_rolls, chunk_size=30000)]
+        self.assertEqual([len(chunk) for chunk in chunks], [30000, 30000, 6036])
+        np.testing.assert_array_equal(np.concatenate(chunks), stored._codes)
+        self.assertIsNone(streamed.results)
+
+    def test_iter_codes_whole_chunks(self):
+        game = Game([Die(np.array([1, 2, 3])) for _ in range(2)], rng=25)
+        game.play(3 * 65536)
+        game.play(10, append=True)
+        self.assertEqual([offset for offset, _ in game._iter_codes()], [0, 3 * 65536])
+        self.assertEqual([offset for offset, _ in game._iter_codes(5)], [5, 3 * 65536])
+
+    def test_play_memmap(self):
+        dice = [Die(np.array(['A', 'B', 'C'])) for _ in range(2)]
+        dice[1].change_weight('C', 0)
+        game = Game(dice, rng=15)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'results.npy')
+            game.play(50, path=path)
+            reopened = Game.open(path)
+            self.assertIsInstance(reopened._codes, np.memmap)
+            pd.testing.assert_frame_equal(reopened.show(), game.show())
+            self.assertEqual(reopened.dice[1].show_die().loc['C', 'Weight'], 0.0)
+            self.assertEqual(Analyzer(reopened).jackpot(), Analyzer(game).jackpot())
+            del game, reopened
+            mixed = Game([Die(np.array([1, 'a'], dtype=object)) for _ in range(2)])
+            with self.assertRaises(ValueError):
+                mixed.play(5, path=os.path.join(folder, 'mixed.npy'))
+            self.assertFalse(os.path.exists(os.path.join(folder, 'mixed.npy')))
+
+    def test_parquet_round_trip(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        dice = [Die(np.array(['A', 'B', 'C'])) for _ in range(2)]
+        dice[0].change_weight('B', 3.0)
+        game = Game(dice, rng=17)
+        game.play(30)
+        game.play(20, append=True)
+        table = game.to_arrow()
+        self.assertEqual(len(game._chunks), 2)
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('die_0').type))
+        pd.testing.assert_frame_equal(Game.from_arrow(table).show(), game.show())
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'results.parquet')
+            game.to_parquet(path, row_group_size=16)
+            reopened = Game.from_parquet(path)
+        pd.testing.assert_frame_equal(reopened.show(), game.show())
+        self.assertEqual(reopened.dice[0].show_die().loc['B', 'Weight'], 3.0)
+        self.assertEqual(Analyzer(reopened).jackpot(), Analyzer(game).jackpot())
+        dice[0].change_weight('B', 9.0)
+        self.assertEqual(Game.from_arrow(game.to_arrow()).dice[0].show_die().loc['B', 'Weight'], 3.0)
+        numbers = Game([Die(np.array([1, 2, 3])) for _ in range(2)], rng=18)
+        numbers.play(25)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'numbers.parquet')
+            numbers.to_parquet(path, row_group_size=10)
+            pd.testing.assert_frame_equal(Game.from_parquet(path).show(), numbers.show())
+
+    def crash_after_first_stretch(self):
+        run_blocks = MC_Sim._run_blocks
+        calls = []
+
+        def crash(*args):
+            calls.append(args)
+            if len(calls) > 1:
+                raise RuntimeError('killed')
+            return run_blocks(*args)
+
+        return mock.patch.object(MC_Sim, '_run_blocks', crash)
+
+    def test_checkpoint_resume(self):
+        dice = [Die(np.array([1, 2, 3])) for _ in range(2)]
+        dice[1].change_weight(3, 4.0)
+        n_rolls = 3 * 65536 + 10
+        uninterrupted = Game(dice, rng=19)
+        uninterrupted.play(n_rolls)
+        finished = Game(dice, rng=19)
+        game = Game(dice, rng=19)
+        with tempfile.TemporaryDirectory() as folder:
+            finished.play(n_rolls, checkpoint=os.path.join(folder, 'finished'), checkpoint_every=65536)
+            np.testing.assert_array_equal(finished._codes, uninterrupted._codes)
+            self.assertEqual(os.listdir(os.path.join(folder, 'finished')), ['state.json'])
+            with self.assertRaises(ValueError):
+                Game.resume(os.path.join(folder, 'finished'))
+            with self.assertRaises(RuntimeError), self.crash_after_first_stretch():
+                game.play(n_rolls, checkpoint=folder, checkpoint_every=65536)
+            resumed = Game.resume(folder)
+            self.assertEqual(sorted(os.listdir(folder)), ['finished', 'state.json'])
+        np.testing.assert_array_equal(resumed._codes, uninterrupted._codes)
+        self.assertEqual(resumed.dice[1].show_die().loc[3, 'Weight'], 4.0)
+        resumed.play(5)
+        uninterrupted.play(5)
+        np.testing.assert_array_equal(resumed._codes, uninterrupted._codes)
+
+    def test_checkpoint_resume_any_generator(self):
+        dice = [Die(np.array([1, 2, 3])) for _ in range(2)]
+        n_rolls = 2 * 65536 + 10
+        uninterrupted = Game(dice, rng=np.random.Generator(np.random.MT19937(5)))
+        uninterrupted.play(n_rolls)
+        game = Game(dice, rng=np.random.Generator(np.random.MT19937(5)))
+        with tempfile.TemporaryDirectory() as folder:
+            checkpoint = os.path.join(folder, 'checkpoint')
+            path = os.path.join(folder, 'results.npy')
+            with self.assertRaises(RuntimeError), self.crash_after_first_stretch():
+                game.play(n_rolls, path=path, checkpoint=checkpoint, checkpoint_every=65536)
+            self.assertEqual(os.listdir(checkpoint), ['state.json'])
+            resumed = Game.resume(checkpoint)
+            self.assertIsInstance(resumed._codes, np.memmap)
+            np.testing.assert_array_equal(resumed._codes, uninterrupted._codes)
+            resumed.play(5)
+            uninterrupted.play(5)
+            np.testing.assert_array_equal(resumed._codes, uninterrupted._codes)
+            seeded = Game(dice, rng=np.random.default_rng(np.array([1, 2])))
+            seeded.play(10, checkpoint=os.path.join(folder, 'seeded'))
+            del game, resumed
+
+    def test_play_async_executor(self):
+        dice = [Die(np.array([1, 2, 3])) for _ in range(2)]
+        stored, streamed, direct = Game(dice, rng=29), Game(dice, rng=29), Game(dice, rng=29)
+        direct.play(50)
+
+        async def run(executor):
+            await stored.play_async(50, executor=executor)
+            return [chunk.copy() async for chunk in streamed.play_iter_async(50, 20, executor=executor)]
+
+        with ThreadPoolExecutor(2) as pool:
+            chunks = asyncio.run(run(pool))
+        np.testing.assert_array_equal(stored._codes, direct._codes)
+        np.testing.assert_array_equal(np.concatenate(chunks), direct._codes)
+        with ProcessPoolExecutor(1) as pool:
+            with self.assertRaises(ValueError):
+                asyncio.run(stored.play_async(5, executor=pool))
+
+    def test_play_async(self):
+        dice = [Die(np.array([1, 2, 3])) for _ in range(3)]
+        stored, streamed = Game(dice, rng=20), Game(dice, rng=20)
+
+        async def run():
+            await stored.play_async(100)
+            return [chunk.copy() async for chunk in streamed.play_iter_async(100, chunk_size=40)]
+
+        chunks = asyncio.run(run())
+        self.assertEqual([len(chunk) for chunk in chunks], [40, 40, 20])
+        np.testing.assert_array_equal(np.concatenate(chunks), stored._codes)
+
     def test_show_wide(self):
         wide = self.game.show('wide')
         self.assertIsInstance(wide, pd.DataFrame)
@@ -45,6 +376,28 @@ class TestGame(unittest.TestCase):
         self.assertIsInstance(narrow, pd.DataFrame)
         self.assertEqual(set(narrow.columns), {'Roll', 'Die', 'Face'})
 
+    def test_show_narrow_missing_faces(self):
+        for faces in [np.array([1.0, np.nan, 3.0]), np.array(['a', None], dtype=object)]:
+            game = Game([Die(faces) for _ in range(2)], rng=30)
+            game.play(20)
+            wide = game.show('wide').rename_axis('Roll').reset_index()
+            melted = wide.melt(id_vars=['Roll'], var_name='Die', value_name='Face')
+            narrow = game.show('narrow')
+            self.assertEqual(narrow['Face'].isna().tolist(), melted['Face'].isna().tolist())
+            self.assertEqual(narrow['Face'].dropna().tolist(), melted['Face'].dropna().tolist())
+
+    def test_show_narrow_matches_melt(self):
+        narrow = self.game.show('narrow')
+        self.assertEqual(len(narrow), 15)
+        self.assertIsInstance(narrow['Face'].dtype, pd.CategoricalDtype)
+        wide = self.game.show('wide').rename_axis('Roll').reset_index()
+        melted = wide.melt(id_vars=['Roll'], var_name='Die', value_name='Face')
+        self.assertEqual(narrow.astype(object).values.tolist(),
+                         melted.astype(object).values.tolist())
+        narrow.loc[0, 'Face'] = 3 if narrow.loc[0, 'Face'] != 3 else 1
+        self.assertEqual(self.game.show('narrow').astype(object).values.tolist(),
+                         melted.astype(object).values.tolist())
+
 
 class TestAnalyzer(unittest.TestCase):
 
@@ -58,19 +411,182 @@ class TestAnalyzer(unittest.TestCase):
         result = self.analyzer.jackpot()
         self.assertTrue(isinstance(result, (int, np.integer)))
 
+    def test_jackpot_rolls(self):
+        rolls = self.analyzer.jackpot_rolls()
+        self.assertEqual(len(rolls), self.analyzer.jackpot())
+        wide = self.game.show('wide')
+        expected = [roll for roll, row in wide.iterrows() if row.nunique() == 1]
+        self.assertEqual(list(rolls), expected)
+
+    def test_jackpot_rolls_share_one_pass(self):
+        analyzer = Analyzer(self.game)
+        with mock.patch.object(MC_Sim, '_jackpot_mask', wraps=MC_Sim._jackpot_mask) as mask:
+            analyzer.jackpot_rolls()
+            analyzer.jackpot()
+        self.assertEqual(mask.call_count, 1)
+
+    def test_matches_analyzer_sparse_keys(self):
+        for n_faces in [6, 20]:
+            batch = GameBatch([[Die(np.arange(n_faces)) for _ in range(10)] for _ in range(3)], rng=28)
+            batch.play(300)
+            combos, perms = batch.combo_count(), batch.perm_count()
+            for i in range(3):
+                analyzer = Analyzer(batch.game(i))
+                combo = combos[f'game_{i}']
+                self.assertEqual(combo[combo > 0].to_dict(), analyzer.combo_count().to_dict())
+                perm = perms[f'game_{i}']
+                self.assertEqual(perm[perm > 0].to_dict(), analyzer.perm_count().to_dict())
+
     def test_face_counts(self):
         counts = self.analyzer.face_counts()
         self.assertIsInstance(counts, pd.DataFrame)
         self.assertGreaterEqual(counts.values.sum(), 0)
 
+    def test_face_counts_values(self):
+        game = Game([Die(np.array(['A', 'B', 'C'])) for _ in range(2)])
+        game.dice[0].change_weights({'A': 0, 'B': 0})
+        game.dice[1].change_weights({'A': 0, 'B': 0})
+        game.play(4)
+        counts = Analyzer(game).face_counts()
+        self.assertEqual(list(counts.columns), ['A', 'B', 'C'])
+        self.assertEqual(counts.values.tolist(), [[0, 0, 2]] * 4)
+
     def test_combo_count(self):
         combos = self.analyzer.combo_count()
         self.assertIsInstance(combos, pd.Series)
 
+    def test_streamed_tallies(self):
+        dice = [Die(np.array(['A', 'B'])) for _ in range(3)]
+        stored, streamed = Game(dice, rng=14), Game(dice, rng=14)
+        stored.play(100)
+        analyzer = Analyzer(stored)
+        tally = Analyzer(streamed, chunks=streamed.play_iter(100, chunk_size=30))
+        self.assertEqual(tally.jackpot(), analyzer.jackpot())
+        pd.testing.assert_series_equal(tally.face_totals(), analyzer.face_totals())
+        self.assertEqual(tally.combo_count().to_dict(), analyzer.combo_count().to_dict())
+        self.assertEqual(tally.perm_count().to_dict(), analyzer.perm_count().to_dict())
+        with self.assertRaises(ValueError):
+            tally.face_counts()
+        with self.assertRaises(ValueError):
+            tally.jackpot_rolls()
+        self.assertIsInstance(tally._tallies['jackpot'], int)
+
+    def test_append_keeps_earlier_tallies(self):
+        dice = [Die(np.array(['A', 'B'])) for _ in range(3)]
+        game = Game(dice, rng=16)
+        game.play(40)
+        analyzer = Analyzer(game)
+        first = analyzer.jackpot()
+        game.play(60, append=True)
+        self.assertEqual(Analyzer(game).perm_count().sum(), 100)
+        self.assertEqual(len(game._chunks), 2)
+        self.assertEqual(game.results.shape, (100, 3))
+        self.assertEqual(list(game.results.index[-2:]), [99, 100])
+        codes = game._codes
+        expected = int((codes == codes[:, :1]).all(axis=1).sum())
+        self.assertEqual(analyzer.jackpot(), expected)
+        self.assertGreaterEqual(analyzer.jackpot(), first)
+        self.assertEqual(analyzer.perm_count().sum(), 100)
+        self.assertEqual(analyzer.face_counts().shape[0], 100)
+        game.play(10)
+        self.assertEqual(analyzer.combo_count().sum(), 10)
+
+    def test_combo_count_values(self):
+        wide = self.game.show('wide')
+        expected = wide.apply(lambda x: tuple(sorted(x)), axis=1).value_counts()
+        self.assertEqual(self.analyzer.combo_count().to_dict(), expected.to_dict())
+
+    def test_combo_count_wide_key_space(self):
+        game = Game([Die(np.arange(100)) for _ in range(10)], rng=22)
+        game.play(50)
+        expected = game.show('wide').apply(lambda x: tuple(sorted(x)), axis=1).value_counts()
+        self.assertEqual(Analyzer(game).combo_count().to_dict(), expected.to_dict())
+
+    def test_combo_count_packed_keys(self):
+        game = Game([Die(np.arange(20)) for _ in range(10)], rng=27)
+        game.play(2000)
+        expected = game.show('wide').apply(lambda x: tuple(sorted(x)), axis=1).value_counts().to_dict()
+        self.assertEqual(Analyzer(game).combo_count().to_dict(), expected)
+        streamed = Analyzer(game, chunks=np.array_split(game._codes, 5))
+        self.assertEqual(streamed.combo_count().to_dict(), expected)
+
+    def test_combo_count_ranked(self):
+        for n_faces, n_dice in [(2, 1), (2, 12), (6, 5), (20, 6)]:
+            game = Game([Die(np.arange(n_faces)) for _ in range(n_dice)], rng=24)
+            game.play(300)
+            expected = game.show('wide').apply(lambda x: tuple(sorted(x)), axis=1).value_counts()
+            self.assertEqual(Analyzer(game).combo_count().to_dict(), expected.to_dict())
+            streamed = Analyzer(game, chunks=np.array_split(game._codes, 3))
+            self.assertEqual(streamed.combo_count().to_dict(), expected.to_dict())
+
+    def test_perm_count_values(self):
+        for n_faces, n_dice in [(2, 3), (50, 5), (100, 10)]:
+            game = Game([Die(np.arange(n_faces)) for _ in range(n_dice)], rng=23)
+            game.play(60)
+            expected = game.show('wide').apply(tuple, axis=1).value_counts()
+            self.assertEqual(Analyzer(game).perm_count().to_dict(), expected.to_dict())
+
+    def test_perm_count_sparse_keys(self):
+        game = Game([Die(np.arange(1, 7)) for _ in range(10)], rng=26)
+        game.play(3000)
+        expected = game.show('wide').apply(tuple, axis=1).value_counts().to_dict()
+        self.assertEqual(Analyzer(game).perm_count().to_dict(), expected)
+        streamed = Analyzer(game, chunks=np.array_split(game._codes, 7))
+        self.assertEqual(streamed.perm_count().to_dict(), expected)
+
     def test_perm_count(self):
         perms = self.analyzer.perm_count()
         self.assertIsInstance(perms, pd.Series)
 
 
+class TestGameBatch(unittest.TestCase):
+
+    def setUp(self):
+        games = []
+        for weight in [1.0, 5.0, 0.0]:
+            dice = [Die(np.array(['A', 'B', 'C'])) for _ in range(2)]
+            dice[1].change_weight('A', weight)
+            games.append(dice)
+        self.batch = GameBatch(games, rng=21)
+        self.batch.play(200)
+
+    def test_play(self):
+        self.assertEqual(self.batch._codes.shape, (3, 200, 2))
+        self.assertNotIn('A', set(self.batch.game(2).show()['die_1']))
+
+    def test_matches_analyzer(self):
+        for i in range(3):
+            analyzer = Analyzer(self.batch.game(i))
+            self.assertEqual(self.batch.jackpot()[i], analyzer.jackpot())
+            np.testing.assert_array_equal(self.batch.face_totals().iloc[i],
+                                          analyzer.face_totals())
+            combos = self.batch.combo_count()[f'game_{i}']
+            self.assertEqual(combos[combos > 0].to_dict(), analyzer.combo_count().to_dict())
+            perms = self.batch.perm_count()[f'game_{i}']
+            self.assertEqual(perms[perms > 0].to_dict(), analyzer.perm_count().to_dict())
+
+    def test_face_counts(self):
+        counts = self.batch.face_counts()
+        self.assertEqual(counts.shape, (600, 3))
+        self.assertTrue((counts.sum(axis=1) == 2).all())
+        pd.testing.assert_frame_equal(counts.loc[1], Analyzer(self.batch.game(1)).face_counts(),
+                                      check_names=False)
+
+    def test_mismatched_games(self):
+        with self.assertRaises(ValueError):
+            GameBatch([[Die(np.array([1, 2]))], [Die(np.array([1, 2])), Die(np.array([1, 2]))]])
+        with self.assertRaises(ValueError):
+            GameBatch([[Die(np.array([1, 2]))], [Die(np.array([1, 3]))]])
+
+    def test_play_near_one(self):
+        class NearOne:
+            def random(self, shape):
+                return np.full(shape, np.nextafter(1, 0) - 2 ** -50)
+        batch = GameBatch([[Die(np.arange(6)) for _ in range(100)] for _ in range(50)])
+        batch._rng = NearOne()
+        batch.play(2)
+        self.assertTrue((batch._codes == 5).all())
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)